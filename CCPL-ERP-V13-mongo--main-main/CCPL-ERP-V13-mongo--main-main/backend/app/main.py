@@ -4,7 +4,7 @@ from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from pathlib import Path
 import logging
-from .database import connect_to_sheets, close_sheets_connection
+from .database import connect_to_mongo, close_mongo_connection
 from .routes import (
     auth,
     users,
@@ -40,15 +40,15 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     try:
-        await connect_to_sheets()
-        logger.info("Google Sheets database connection successful")
+        await connect_to_mongo()
+        logger.info("MongoDB connection successful")
     except Exception as e:
-        logger.warning(f"Sheets database connection failed: {str(e)}")
+        logger.warning(f"MongoDB connection failed: {str(e)}")
         logger.warning("App starting with database unavailable - use for testing only")
     yield
     # Shutdown
     try:
-        await close_sheets_connection()
+        await close_mongo_connection()
     except Exception as e:
         logger.warning(f"Error closing database connection: {str(e)}")
 
@@ -12,6 +12,35 @@ from .transfer import StockTransfer, TransferStatus
 from .adjustment import StockAdjustment, AdjustmentType
 from .master_data import Category, Brand, Season, Color, Size
 from .audit_log import AuditLog, AuditAction
+from .settings import AppSettings
+from .supplier_master import SupplierMaster
+from .item import ItemMaster
+from .item_type import ItemType
+from .category_hierarchy import (
+    ItemCategory, ItemSubCategory, ItemDivision, ItemClass, ItemSubClass
+)
+from .colour_master import ColourMaster
+from .size_master import SizeMaster
+from .uom_master import UOMMaster
+from .variant_groups import VariantGroup
+from .brand_master import BrandMaster
+from .specifications import CategorySpecifications, ItemSpecifications
+from .file_master import FileMaster
+
+# All Beanie document models, registered once by init_beanie at startup
+DOCUMENT_MODELS = [
+    User, Role, Permission,
+    Product, Inventory,
+    Supplier, SupplierMaster,
+    PurchaseOrder, Customer, SaleOrder,
+    Warehouse, StockMovement, StockTransfer, StockAdjustment,
+    AuditLog, AppSettings,
+    ItemMaster, ItemType,
+    ItemCategory, ItemSubCategory, ItemDivision, ItemClass, ItemSubClass,
+    ColourMaster, SizeMaster, UOMMaster, VariantGroup, BrandMaster,
+    CategorySpecifications, ItemSpecifications,
+    FileMaster, Category, Brand, Season, Color, Size,
+]
 
 __all__ = [
     "User",
@@ -35,4 +64,5 @@ __all__ = [
     "Color",
     "Size",
     "AuditLog",
+    "DOCUMENT_MODELS",
 ]
@@ -2,7 +2,7 @@
 These are pure Pydantic models (not Beanie Documents) since BOM data
 is stored in Google Sheets, not MongoDB.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
@@ -20,12 +20,16 @@ class Article(BaseModel):
     plan_date: str = ""
     remarks: str = ""
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MasterArticle(BaseModel):
     """Article from MASTER DATA sheet."""
     art_no: str
     sketch_link: str = ""
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Color(BaseModel):
     """Color from MASTER DATA sheet."""
@@ -33,6 +37,8 @@ class Color(BaseModel):
     code: str = ""
     name: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class FabricQuality(BaseModel):
     """Fabric quality from FABRIC MASTERDATA sheet."""
@@ -40,6 +46,8 @@ class FabricQuality(BaseModel):
     unit: str = "kg"
     avg_roll_size: float = 25
 
+    model_config = ConfigDict(frozen=True)
+
 
 class MasterData(BaseModel):
     """All master data combined."""
@@ -102,6 +110,8 @@ class BOMHeader(BaseModel):
     created_at: str = ""
     updated_at: str = ""
     created_by: str = ""
+    total_ready_kg: float = 0
+    total_greige_kg: float = 0
 
 
 class BOM(BaseModel):
@@ -118,7 +128,7 @@ class BOMSaveRequest(BaseModel):
 
 
 class BOMIndexItem(BaseModel):
-    """BOM summary for index listing."""
+    """BOM summary for index listing (read-only)."""
     uid: str
     art_no: str
     set_no: str = ""
@@ -135,6 +145,10 @@ class BOMIndexItem(BaseModel):
     created_at: str = ""
     updated_at: str = ""
     created_by: str = ""
+    total_ready_kg: float = 0
+    total_greige_kg: float = 0
+
+    model_config = ConfigDict(frozen=True)
 
 
 class BOMIndexFilter(BaseModel):
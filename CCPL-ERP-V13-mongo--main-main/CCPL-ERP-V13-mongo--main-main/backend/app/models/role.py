@@ -1,5 +1,6 @@
 from .sheet_document import SheetDocument
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from functools import cached_property
 from typing import Optional, List
 from datetime import datetime
 
@@ -57,9 +58,28 @@ class Role(SheetDocument):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Re-run validators on assignment, so assigning permission_codes
+    # drops the cached _permission_set
+    model_config = ConfigDict(validate_assignment=True)
+
     class Settings:
         name = "roles"
         unique_fields = ["name", "slug"]
 
+    @cached_property
+    def _permission_set(self) -> frozenset:
+        """permission_codes as a frozenset, for O(1) has_permission.
+        Cached in the instance __dict__, so later calls are a plain
+        attribute read (a PrivateAttr goes through __getattr__); the
+        leading underscore keeps it out of the fields Beanie saves.
+        In-place edits of the list are not seen, assign a new list instead.
+        """
+        return frozenset(self.permission_codes)
+
+    @model_validator(mode="after")
+    def _reset_permission_set(self):
+        self.__dict__.pop("_permission_set", None)
+        return self
+
     def has_permission(self, permission_code: str) -> bool:
-        return permission_code in self.permission_codes
+        return permission_code in self._permission_set
@@ -5,45 +5,90 @@ import re
 from typing import Any, Callable, Dict, List, Optional
 
 
+def _to_float(value: Any) -> Optional[float]:
+    """float(value), or None when the value is not numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
 class FilterExpr:
-    """Represents a single filter condition."""
-    __slots__ = ('field', 'op', 'value')
+    """Represents a single filter condition.
+
+    ``match`` is bound to the op-specific method at construction, so
+    filtering a tab does not re-dispatch on ``op`` for every row.
+    """
+    __slots__ = ('field', 'op', 'value', '_sval', '_fval', '_re', 'match')
 
     def __init__(self, field: str, op: str, value: Any):
         self.field = field
         self.op = op
         self.value = value
+        # Coerced once here; a None _fval makes float comparisons raise
+        # TypeError and fall back to the string comparison.
+        self._sval = str(value)
+        self._fval = _to_float(value)
+        self._re = None
+        if op == 'regex':
+            flags = re.IGNORECASE if value.get('flags') else 0
+            self._re = re.compile(value['pattern'], flags)
+        self.match = getattr(self, _MATCHERS.get(op, '_match_none'))
+
+    def _match_eq(self, row: Dict) -> bool:
+        val = row.get(self.field, '')
+        if self.value is None:
+            return val == '' or val is None or val == 'None'
+        return str(val) == self._sval
+
+    def _match_ne(self, row: Dict) -> bool:
+        val = row.get(self.field, '')
+        if self.value is None:
+            return val != '' and val is not None and val != 'None'
+        return str(val) != self._sval
+
+    def _match_lt(self, row: Dict) -> bool:
+        val = row.get(self.field, '')
+        try: return float(val) < self._fval
+        except (ValueError, TypeError): return str(val) < self._sval
+
+    def _match_gt(self, row: Dict) -> bool:
+        val = row.get(self.field, '')
+        try: return float(val) > self._fval
+        except (ValueError, TypeError): return str(val) > self._sval
+
+    def _match_lte(self, row: Dict) -> bool:
+        val = row.get(self.field, '')
+        try: return float(val) <= self._fval
+        except (ValueError, TypeError): return str(val) <= self._sval
 
-    def match(self, row: Dict) -> bool:
+    def _match_gte(self, row: Dict) -> bool:
         val = row.get(self.field, '')
-        if self.op == 'eq':
-            if self.value is None:
-                return val == '' or val is None or val == 'None'
-            return str(val) == str(self.value)
-        elif self.op == 'ne':
-            if self.value is None:
-                return val != '' and val is not None and val != 'None'
-            return str(val) != str(self.value)
-        elif self.op == 'lt':
-            try: return float(val) < float(self.value)
-            except (ValueError, TypeError): return str(val) < str(self.value)
-        elif self.op == 'gt':
-            try: return float(val) > float(self.value)
-            except (ValueError, TypeError): return str(val) > str(self.value)
-        elif self.op == 'lte':
-            try: return float(val) <= float(self.value)
-            except (ValueError, TypeError): return str(val) <= str(self.value)
-        elif self.op == 'gte':
-            try: return float(val) >= float(self.value)
-            except (ValueError, TypeError): return str(val) >= str(self.value)
-        elif self.op == 'startswith':
-            return str(val).startswith(str(self.value))
-        elif self.op == 'regex':
-            flags = re.IGNORECASE if self.value.get('flags') else 0
-            return bool(re.search(self.value['pattern'], str(val), flags))
+        try: return float(val) >= self._fval
+        except (ValueError, TypeError): return str(val) >= self._sval
+
+    def _match_startswith(self, row: Dict) -> bool:
+        return str(row.get(self.field, '')).startswith(self._sval)
+
+    def _match_regex(self, row: Dict) -> bool:
+        return self._re.search(str(row.get(self.field, ''))) is not None
+
+    def _match_none(self, row: Dict) -> bool:
         return False
 
 
+_MATCHERS = {
+    'eq': '_match_eq',
+    'ne': '_match_ne',
+    'lt': '_match_lt',
+    'gt': '_match_gt',
+    'lte': '_match_lte',
+    'gte': '_match_gte',
+    'startswith': '_match_startswith',
+    'regex': '_match_regex',
+}
+
+
 class FieldProxy:
     """Proxy for model class attributes that captures comparison operations."""
     __slots__ = ('field_name',)
@@ -76,64 +121,91 @@ class FieldProxy:
         return hash(self.field_name)
 
 
+def _compile_operators(field_name: str, ops: Dict) -> List[Callable]:
+    """Turn a {'$regex': ..., '$gte': ...} operator dict into predicates."""
+    preds = []
+    if '$regex' in ops:
+        flags = re.IGNORECASE if ops.get('$options') == 'i' else 0
+        search = re.compile(ops['$regex'], flags).search
+
+        def _regex(row, f=field_name, search=search):
+            return search(str(row.get(f, ''))) is not None
+        preds.append(_regex)
+    if '$gte' in ops:
+        def _gte(row, f=field_name, fv=_to_float(ops['$gte']), sv=str(ops['$gte'])):
+            cell_val = row.get(f, '')
+            try:
+                return float(cell_val) >= fv
+            except (ValueError, TypeError):
+                return str(cell_val) >= sv
+        preds.append(_gte)
+    if '$lte' in ops:
+        def _lte(row, f=field_name, fv=_to_float(ops['$lte']), sv=str(ops['$lte'])):
+            cell_val = row.get(f, '')
+            try:
+                return float(cell_val) <= fv
+            except (ValueError, TypeError):
+                return str(cell_val) <= sv
+        preds.append(_lte)
+    if '$gt' in ops:
+        def _gt(row, f=field_name, fv=_to_float(ops['$gt'])):
+            try:
+                return float(row.get(f, '')) > fv
+            except (ValueError, TypeError):
+                return False
+        preds.append(_gt)
+    if '$lt' in ops:
+        def _lt(row, f=field_name, fv=_to_float(ops['$lt'])):
+            try:
+                return float(row.get(f, '')) < fv
+            except (ValueError, TypeError):
+                return False
+        preds.append(_lt)
+    return preds
+
+
 def parse_dict_query(query: Dict) -> Callable:
-    """Parse a MongoDB-style dict query into a filter function."""
+    """Parse a MongoDB-style dict query into a filter function.
+
+    The query is walked once here; the returned function only runs the
+    per-field predicates, with regexes and $or branches already compiled.
+    """
+    preds: List[Callable] = []
+    for key, value in query.items():
+        if key == '$or':
+            sub_fns = [parse_dict_query(sq) for sq in value]
+
+            def _or(row, sub_fns=sub_fns):
+                for fn in sub_fns:
+                    if fn(row):
+                        return True
+                return False
+            preds.append(_or)
+            continue
+
+        # Handle FieldProxy keys
+        field_name = key.field_name if isinstance(key, FieldProxy) else str(key)
+
+        if isinstance(value, dict):
+            # MongoDB operators
+            preds.extend(_compile_operators(field_name, value))
+        elif isinstance(value, FilterExpr):
+            preds.append(value.match)
+        elif value is None:
+            def _is_null(row, f=field_name):
+                cell_val = row.get(f, '')
+                return cell_val == '' or cell_val is None or cell_val == 'None'
+            preds.append(_is_null)
+        else:
+            # Simple equality
+            def _eq(row, f=field_name, sv=str(value)):
+                return str(row.get(f, '')) == sv
+            preds.append(_eq)
+
     def _match(row: Dict) -> bool:
-        for key, value in query.items():
-            if key == '$or':
-                sub_fns = [parse_dict_query(sq) for sq in value]
-                if not any(fn(row) for fn in sub_fns):
-                    return False
-                continue
-
-            # Handle FieldProxy keys
-            field_name = key.field_name if isinstance(key, FieldProxy) else str(key)
-            cell_val = row.get(field_name, '')
-
-            if isinstance(value, dict):
-                # MongoDB operators
-                if '$regex' in value:
-                    pattern = value['$regex']
-                    flags = re.IGNORECASE if value.get('$options') == 'i' else 0
-                    if not re.search(pattern, str(cell_val), flags):
-                        return False
-                if '$gte' in value:
-                    try:
-                        if not (float(cell_val) >= float(value['$gte'])):
-                            return False
-                    except (ValueError, TypeError):
-                        if not (str(cell_val) >= str(value['$gte'])):
-                            return False
-                if '$lte' in value:
-                    try:
-                        if not (float(cell_val) <= float(value['$lte'])):
-                            return False
-                    except (ValueError, TypeError):
-                        if not (str(cell_val) <= str(value['$lte'])):
-                            return False
-                if '$gt' in value:
-                    try:
-                        if not (float(cell_val) > float(value['$gt'])):
-                            return False
-                    except (ValueError, TypeError):
-                        return False
-                if '$lt' in value:
-                    try:
-                        if not (float(cell_val) < float(value['$lt'])):
-                            return False
-                    except (ValueError, TypeError):
-                        return False
-            elif isinstance(value, FilterExpr):
-                if not value.match(row):
-                    return False
-            else:
-                # Simple equality
-                if value is None:
-                    if cell_val != '' and cell_val is not None and cell_val != 'None':
-                        return False
-                else:
-                    if str(cell_val) != str(value):
-                        return False
+        for pred in preds:
+            if not pred(row):
+                return False
         return True
     return _match
 
@@ -156,7 +228,18 @@ def build_filter_from_args(args) -> Optional[Callable]:
 
     if not filters:
         return None
+    if len(filters) == 1:
+        return filters[0]
+    if len(filters) == 2:
+        first, second = filters
+
+        def combined_pair(row):
+            return first(row) and second(row)
+        return combined_pair
 
     def combined(row):
-        return all(f(row) for f in filters)
+        for f in filters:
+            if not f(row):
+                return False
+        return True
     return combined
@@ -40,11 +40,14 @@ class SheetQuery:
 
     def _apply(self) -> list:
         """Apply sort, skip, limit to results."""
-        data = list(self._results)
+        data = self._results
 
         if self._sort_field:
+            # sorted() calls the key once per row, not per comparison
+            field = self._sort_field
+
             def sort_key(row):
-                val = row.get(self._sort_field, '')
+                val = row.get(field, '')
                 if val == '' or val is None:
                     return ''
                 # Try numeric sort
@@ -52,15 +55,14 @@ class SheetQuery:
                     return float(val)
                 except (ValueError, TypeError):
                     return str(val)
-            data.sort(key=sort_key, reverse=self._sort_reverse)
-
-        if self._skip_n:
-            data = data[self._skip_n:]
+            data = sorted(data, key=sort_key, reverse=self._sort_reverse)
 
-        if self._limit_n is not None:
-            data = data[:self._limit_n]
+        if self._skip_n or self._limit_n is not None:
+            stop = None if self._limit_n is None else self._skip_n + self._limit_n
+            data = data[self._skip_n:stop]
 
-        return data
+        # A copy, so callers never get self._results itself
+        return list(data)
 
     async def to_list(self) -> list:
         """Execute query and return list of model instances."""
@@ -7,6 +7,12 @@ from fastapi import APIRouter, HTTPException, Depends
 from typing import Optional, List
 import logging
 
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as RowsResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as RowsResponse
+
 from ..models.bom import (
     MasterData, BOM, BOMSaveRequest, BOMIndexItem,
     DyeingPlan, AllocateRequest, AllocateResponse,
@@ -127,9 +133,11 @@ async def list_boms(
     service: SheetsService = Depends(get_service),
     current_user=Depends(get_current_user),
 ):
-    """List BOMs with optional filtering."""
+    """List BOMs with optional filtering.
+    Rows are serialized directly; they already match BOMIndexItem.
+    """
     try:
-        return service.load_bom_index(status=status, dplan_no=dplan_no)
+        return RowsResponse(service.load_bom_index_rows(status=status, dplan_no=dplan_no))
     except Exception as e:
         logger.error(f"Error listing BOMs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
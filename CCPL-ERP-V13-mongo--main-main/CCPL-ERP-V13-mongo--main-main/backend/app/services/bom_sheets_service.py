@@ -1,9 +1,16 @@
 """Google Sheets service layer for Dyeing BOM module.
 Ported from BOM-main project - replicates CODE.GS functionality.
 """
+import logging
 import os
+import random
+import re
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
 
 from ..config import settings
 from ..models.bom import (
@@ -20,6 +27,258 @@ try:
 except ImportError:
     GOOGLE_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limit and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _execute(request, max_retries: int = 5, idempotent: bool = True):
+    """Execute a Google API request, retrying rate-limit/server errors.
+    Each wait is drawn at random from a window that doubles per attempt
+    (1s, 2s, 4s ... capped at 32s), so concurrent callers spread out.
+    Non-idempotent requests (appends) are only retried on 429, since a
+    5xx may come back after the rows were already written.
+    """
+    retry_statuses = RETRY_STATUSES if idempotent else (429,)
+    for attempt in range(max_retries + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if e.resp.status not in retry_statuses or attempt == max_retries:
+                raise
+            wait = random.uniform(0, min(32, 2 ** attempt)) + 0.5
+            logger.warning(f"Sheets API returned {e.resp.status}, retrying in {wait:.1f}s "
+                           f"(attempt {attempt + 1}/{max_retries})")
+            time.sleep(wait)
+
+
+# Database sheet schemas: (sheet name, header row)
+DB_SHEET_SCHEMAS = (
+    ('BOM_INDEX', (
+        'BOM_UID', 'ART_NO', 'SET_NO', 'SEASON', 'BUYER', 'PLAN_DATE', 'PLAN_QTY',
+        'REMARKS', 'COMBO_COUNT', 'LINE_COUNT', 'STATUS', 'DPLAN_NO', 'SHEET_NAME',
+        'CREATED_AT', 'UPDATED_AT', 'CREATED_BY', 'TOTAL_READY_KG', 'TOTAL_GREIGE_KG'
+    )),
+    ('BOM_DATA', (
+        'BOM_UID', 'ROW_TYPE', 'COMBO_SR_NO', 'COMBO_NAME', 'LOT_NO', 'LOT_COUNT',
+        'COLOR_ID', 'COLOR_CODE', 'COLOR_NAME', 'PLAN_QTY',
+        'FABRIC_QUALITY', 'FC_NO', 'PLAN_RAT_GSM', 'PRIORITY', 'COMPONENT', 'AVG', 'UNIT',
+        'EXTRA_PCT', 'WASTAGE_PCT', 'SHORTAGE_PCT',
+        'READY_FABRIC_NEED', 'GREIGE_FABRIC_NEED', 'NO_OF_ROLLS',
+        'GREIGE_IS_MANUAL', 'LINE_ORDER'
+    )),
+    ('DPLAN_INDEX', (
+        'DPLAN_NO', 'BOM_COUNT', 'TOTAL_QTY', 'CREATED_AT', 'CREATED_BY', 'NOTES'
+    )),
+)
+
+
+def _float_col(col: np.ndarray, used: np.ndarray) -> np.ndarray:
+    """Convert a column of sheet cells to float64.
+    Blank cells become 0. A non-numeric cell raises ValueError if its row
+    is marked in used (a BOM row that reads this column), as a per-cell
+    float() did; elsewhere (notes typed below or between combos) it
+    becomes 0.
+    """
+    out = np.zeros(len(col))
+    filled = col != ''
+    try:
+        out[filled] = col[filled].astype(float)
+    except ValueError:
+        for i in np.flatnonzero(filled).tolist():
+            try:
+                out[i] = float(col[i])
+            except ValueError:
+                if used[i]:
+                    raise
+    return out
+
+
+# Columns read back from the DB sheets (BOM_INDEX A:R, BOM_DATA A:X, DPLAN_INDEX A:F)
+INDEX_COLS = 18
+DATA_COLS = 24
+DPLAN_COLS = 6
+
+
+def _pad(row: List[Any], width: int) -> List[Any]:
+    """Pad a sheet row (trailing blanks are dropped by the API) to width."""
+    return row + [''] * (width - len(row)) if len(row) < width else row
+
+
+def _num(value: Any, cast=float, default: Any = 0):
+    """Convert a cell with cast, or return default for a blank cell."""
+    return cast(value) if value else default
+
+
+def _index_row_dict(row: List[Any]) -> Dict[str, Any]:
+    """Map a formatted BOM_INDEX row to BOMIndexItem / BOMHeader fields.
+    Formatted cells are already strings, so text columns are taken as is.
+    """
+    (uid, art_no, set_no, season, buyer, plan_date, plan_qty, remarks,
+     combo_count, line_count, status, dplan_no, sheet_name, created_at,
+     updated_at, created_by, total_ready_kg, total_greige_kg) = _pad(row, INDEX_COLS)[:INDEX_COLS]
+    return {
+        'uid': uid,
+        'art_no': art_no,
+        'set_no': set_no,
+        'season': season,
+        'buyer': buyer,
+        'plan_date': plan_date,
+        'plan_qty': _num(plan_qty),
+        'remarks': remarks,
+        'combo_count': _num(combo_count, int),
+        'line_count': _num(line_count, int),
+        'status': status,
+        'dplan_no': dplan_no,
+        'sheet_name': sheet_name,
+        'created_at': created_at,
+        'updated_at': updated_at,
+        'created_by': created_by,
+        'total_ready_kg': _num(total_ready_kg),
+        'total_greige_kg': _num(total_greige_kg),
+    }
+
+
+def _combo_from_row(row: List[Any], _str=str, _num=_num, _make=Combo.model_construct) -> Combo:
+    """Build a Combo from a padded BOM_DATA PLANNING row.
+    Builtins are bound as defaults so the per-row lookups are locals.
+    """
+    return _make(
+        combo_sr_no=_num(row[2], int, 1),
+        combo_name=_str(row[3]),
+        lot_no=_str(row[4]),
+        lot_count=_num(row[5], int, 1),
+        color_id=_str(row[6]),
+        color_code=_str(row[7]),
+        color_name=_str(row[8]),
+        plan_qty=_num(row[9]),
+        bom_lines=[]
+    )
+
+
+def _bom_line_from_row(row: List[Any], _str=str, _num=_num, _make=BOMLine.model_construct) -> BOMLine:
+    """Build a BOMLine from a padded BOM_DATA BOM_LINE row."""
+    return _make(
+        fabric_quality=_str(row[10]),
+        fc_no=_str(row[11]),
+        plan_rat_gsm=_str(row[12]),
+        priority=_str(row[13]),
+        component=_str(row[14]),
+        avg=_num(row[15]),
+        unit=_str(row[16]),
+        extra_pcs=_num(row[17]),
+        wastage_pcs=_num(row[18]),
+        shortage=_num(row[19]),
+        ready_fabric_need=_num(row[20]),
+        greige_fabric_need=_num(row[21]),
+        no_of_rolls=_num(row[22], float, None),
+        greige_is_manual=bool(row[23])
+    )
+
+
+# Columnar (structure-of-arrays) layout of the numeric BOMLine fields, one
+# record per line in combo order, for the vector arithmetic in recompute_bom.
+BOM_LINE_DTYPE = np.dtype([
+    ('combo_idx', 'i4'),
+    ('plan_qty', 'f8'),
+    ('avg', 'f8'),
+    ('extra_pcs', 'f8'),
+    ('wastage_pcs', 'f8'),
+    ('shortage', 'f8'),
+    ('ready_fabric_need', 'f8'),
+    ('greige_fabric_need', 'f8'),
+    ('no_of_rolls', 'f8'),
+    ('is_kg', '?'),
+    ('is_pcs', '?'),
+])
+
+
+def lines_to_soa(combos: List[Combo]) -> np.ndarray:
+    """Flatten the BOM lines of all combos into a BOM_LINE_DTYPE array.
+    Missing numbers become 0 (no_of_rolls becomes NaN).
+    """
+    records = [
+        (c_idx, combo.plan_qty or 0, line.avg or 0, line.extra_pcs or 0,
+         line.wastage_pcs or 0, line.shortage or 0, line.ready_fabric_need or 0,
+         line.greige_fabric_need or 0,
+         line.no_of_rolls if line.no_of_rolls is not None else np.nan,
+         line.unit == 'kg', line.unit == 'Pcs')
+        for c_idx, combo in enumerate(combos)
+        for line in combo.bom_lines
+    ]
+    return np.array(records, dtype=BOM_LINE_DTYPE)
+
+
+def recompute_bom(combos: List[Combo]) -> None:
+    """Recompute ready/greige fabric need and kg roll count for every BOM line in place.
+    All lines of the BOM are flattened into NumPy columns so the arithmetic
+    runs as a few vector operations instead of per-line Python math.
+    Pcs lines with a manually entered greige need keep that value.
+    """
+    soa = lines_to_soa(combos)
+    if not len(soa):
+        return
+
+    order_qty = soa['plan_qty']
+    is_manual = soa['is_pcs'] & (soa['greige_fabric_need'] != 0)
+
+    ready = (order_qty + order_qty * soa['extra_pcs'] + order_qty * soa['wastage_pcs']) * soa['avg']
+    greige = np.where(is_manual, soa['greige_fabric_need'], ready * (1 + soa['shortage']))
+    rolls = np.where(soa['is_kg'], greige / 25, np.nan)
+
+    lines = [line for combo in combos for line in combo.bom_lines]
+    for line, r, g, m, n in zip(lines, ready.tolist(), greige.tolist(), is_manual.tolist(), rolls.tolist()):
+        line.ready_fabric_need = r
+        line.greige_fabric_need = g
+        line.greige_is_manual = m
+        line.no_of_rolls = None if n != n else n
+
+
+# Header cells read from every article tab, in this order:
+# plan date, plan qty, art no, set no, season, buyer, remarks
+ARTICLE_HEADER_CELLS = ('T1', 'W2', 'P2', 'P3', 'O1', 'W3', 'O5')
+
+# Reference ranges read by the master-data getters
+MASTER_RANGES = {
+    'components': "'MASTER DATA'!A2:A200",
+    'master_articles': "'MASTER DATA'!I2:J2500",
+    'colors': "'MASTER DATA'!C2:E500",
+    # Only FINAL ITEM, AVG ROLL SIZE and UNIT (columns I:K) are used
+    'fabrics': "'FABRIC MASTERDATA'!I3:K3200",
+}
+
+# Ranges per values.batchGet request, to stay under the URL length limit
+BATCH_GET_CHUNK = 100
+
+# Rows in an article tab's BOM body (A16:Y1000)
+TAB_BODY_ROWS = 985
+
+# Partial-response mask for writes whose reply is not used; an empty
+# mask means "all fields", so the smallest field is asked for instead
+WRITE_REPLY_FIELDS = 'spreadsheetId'
+
+# Rows per values.append request, well under the request size limit
+APPEND_CHUNK_ROWS = 5000
+
+# Seconds the tab list is trusted before re-reading spreadsheet metadata
+# (tabs can also be added or removed by hand in the Sheets UI)
+SHEET_NAMES_TTL = 60.0
+
+# Seconds the reference lists in master data (colors, components, master
+# articles, fabrics) are reused; they change rarely and only by hand
+MASTER_DATA_TTL = 60.0
+
+# Seconds a range read is served from memory; covers the UI polling
+# /list, /plans and /master-data in quick succession
+READ_CACHE_TTL = 2.0
+
+# DB sheet ranges; cached like any other read. A write drops only this
+# process's copy (other workers and hand edits are not seen), so they get
+# the same short TTL
+BOM_INDEX_RANGE = "'BOM_INDEX'!A:R"
+BOM_DATA_RANGE = "'BOM_DATA'!A:Y"
+
 
 class SheetsService:
     """Service for interacting with Google Sheets."""
@@ -41,6 +300,25 @@ class SheetsService:
         self.service = None
         self.demo_mode = False
         self.error_message = None
+        # (range, render option) -> (fetched_at, values); dropped on every
+        # write, expired entries are evicted whenever a new read is stored
+        self._read_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # (fetched_at, {field: list}) reference lists from the last master load
+        self._master_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # BOM_UID -> BOM_INDEX sheet row, filled on the first edit lookup
+        self._bom_index_rows: Optional[Dict[str, int]] = None
+        # (BOM_INDEX read, STATUS column, DPLAN_NO column) of that exact read
+        self._bom_index_cols: Optional[Tuple[List[List[Any]], np.ndarray, np.ndarray]] = None
+        # (BOM_DATA read, {uid: rows}) built from that exact cached read
+        self._bom_data_groups: Optional[Tuple[List[List[Any]], Dict[str, List[List[Any]]]]] = None
+        # tab title -> sheetId, in spreadsheet order
+        self._sheet_ids: Optional[Dict[str, int]] = None
+        self._sheet_ids_at = 0.0
+        # Header rows of pre-existing DB sheets checked against the schemas
+        self._db_headers_checked = False
+        # Demo index rows / plans, built on first use
+        self._demo_index_rows: Optional[List[Dict[str, Any]]] = None
+        self._demo_dplans: Optional[List[DyeingPlan]] = None
 
         # Check if we should use demo mode
         if not settings.BOM_SPREADSHEET_ID or settings.BOM_SPREADSHEET_ID == "your_spreadsheet_id_here":
@@ -78,87 +356,295 @@ class SheetsService:
             raise Exception("Google Sheets not configured. Add credentials.json")
         return self.service.spreadsheets()
 
-    def _get_values(self, range_name: str) -> List[List[Any]]:
-        """Get values from a range."""
-        result = self._get_sheet().values().get(
+    def _get_values(self, range_name: str, render: str = 'FORMATTED_VALUE',
+                    ttl: float = READ_CACHE_TTL) -> List[List[Any]]:
+        """Get values from a range (served from the short-lived read cache).
+        render='UNFORMATTED_VALUE' returns numbers and booleans as native
+        values; dates still come back as their formatted strings.
+        """
+        cached = self._cached_values(range_name, render, ttl)
+        if cached is not None:
+            return cached
+        now = time.monotonic()
+        result = _execute(self._get_sheet().values().get(
             spreadsheetId=self.spreadsheet_id,
-            range=range_name
-        ).execute()
-        return result.get('values', [])
+            range=range_name,
+            valueRenderOption=render,
+            dateTimeRenderOption='FORMATTED_STRING',
+            fields='values'
+        ))
+        values = result.get('values', [])
+        self._store_read(range_name, render, now, values)
+        return values
+
+    def _cached_values(self, range_name: str, render: str = 'FORMATTED_VALUE',
+                       ttl: float = READ_CACHE_TTL) -> Optional[List[List[Any]]]:
+        """A read-cache entry still younger than ttl, or None."""
+        cached = self._read_cache.get((range_name, render))
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+
+    def _store_read(self, range_name: str, render: str, fetched_at: float, values: Any):
+        """Cache a range read, evicting entries past READ_CACHE_TTL so
+        ranges that are never read again do not pile up."""
+        expired = [k for k, (t, _) in self._read_cache.items()
+                   if fetched_at - t >= READ_CACHE_TTL]
+        for key in expired:
+            del self._read_cache[key]
+        self._read_cache[(range_name, render)] = (fetched_at, values)
+
+    def _batch_get_values(self, ranges: List[str], render: str = 'FORMATTED_VALUE') -> List[List[List[Any]]]:
+        """Get values for several ranges with values.batchGet.
+        Results are returned in the order of ``ranges`` and also fill the
+        read cache, so later single-range reads of the same cells are free.
+        """
+        results = []
+        now = time.monotonic()
+        for start in range(0, len(ranges), BATCH_GET_CHUNK):
+            chunk = ranges[start:start + BATCH_GET_CHUNK]
+            result = _execute(self._get_sheet().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=chunk,
+                valueRenderOption=render,
+                dateTimeRenderOption='FORMATTED_STRING',
+                fields='valueRanges(values)'
+            ))
+            for range_name, vr in zip(chunk, result.get('valueRanges', [])):
+                values = vr.get('values', [])
+                self._store_read(range_name, render, now, values)
+                results.append(values)
+        return results
+
+    def _get_bom_index(self, fresh: bool = False) -> List[List[Any]]:
+        """All BOM_INDEX rows (header included), shared by display and list
+        callers through the read cache. fresh=True always reads the sheet
+        (and refreshes the cache); use it for reads that feed a write or
+        hand out UIDs.
+        """
+        return self._get_values(BOM_INDEX_RANGE, ttl=0 if fresh else READ_CACHE_TTL)
+
+    def _bom_index_for_dplan(self, dplan_no: str) -> List[List[Any]]:
+        """BOM_INDEX rows allocated to one Dyeing Plan, header first.
+        Served from the cached full read when there is one; otherwise only
+        the DPLAN column is read and the matching rows are fetched with one
+        batchGet of contiguous runs, so a plan holding a few BOMs does not
+        pull the whole index.
+        """
+        cached = self._cached_values(BOM_INDEX_RANGE)
+        if cached is not None:
+            return cached
+
+        column = self._get_values("'BOM_INDEX'!L:L")
+        matches = [i for i, row in enumerate(column, start=1)
+                   if i > 1 and row and str(row[0]) == dplan_no]
+        if not matches:
+            return []
+
+        runs = []
+        for i in matches:
+            if runs and runs[-1][1] == i - 1:
+                runs[-1][1] = i
+            else:
+                runs.append([i, i])
+        ranges = [f"'BOM_INDEX'!A{first}:R{last}" for first, last in runs]
+        rows = [[]]
+        for values in self._batch_get_values(ranges):
+            rows.extend(values)
+        return rows
+
+    def _bom_index_filter_cols(self, data: List[List[Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """STATUS and DPLAN_NO columns of a BOM_INDEX read as string arrays.
+        Built once per cached read, so successive filtered listings are
+        a vectorized compare each.
+        """
+        if self._bom_index_cols is None or self._bom_index_cols[0] is not data:
+            rows = data[1:]
+            status_col = np.array([row[10] if len(row) > 10 else '' for row in rows], dtype=str)
+            dplan_col = np.array([row[11] if len(row) > 11 else '' for row in rows], dtype=str)
+            self._bom_index_cols = (data, status_col, dplan_col)
+        return self._bom_index_cols[1], self._bom_index_cols[2]
+
+    def _bom_data_rows(self, uid: str) -> List[List[Any]]:
+        """BOM_DATA rows of one BOM, in sheet order.
+        The sheet is grouped by UID once per cached read, so repeated
+        loads while the read is fresh are a dict lookup.
+        """
+        # Read unformatted: numbers come back unrounded and
+        # GREIGE_IS_MANUAL as a real bool instead of "FALSE"
+        data = self._get_values(BOM_DATA_RANGE, render='UNFORMATTED_VALUE')
+        if self._bom_data_groups is None or self._bom_data_groups[0] is not data:
+            groups: Dict[str, List[List[Any]]] = {}
+            for row in data[1:]:
+                if row:
+                    groups.setdefault(str(row[0]), []).append(row)
+            self._bom_data_groups = (data, groups)
+        return self._bom_data_groups[1].get(uid, [])
+
+    def _invalidate_reads(self, *range_names: str):
+        """Drop cached range reads after a write.
+        With range names, only reads of the sheets they belong to are
+        dropped; without, the whole cache is cleared.
+        """
+        if not range_names:
+            self._read_cache.clear()
+            return
+        sheets = {name.split('!')[0] for name in range_names}
+        for key in [k for k in self._read_cache if k[0].split('!')[0] in sheets]:
+            del self._read_cache[key]
 
     def _update_values(self, range_name: str, values: List[List[Any]]):
         """Update values in a range."""
-        self._get_sheet().values().update(
+        self._invalidate_reads(range_name)
+        _execute(self._get_sheet().values().update(
             spreadsheetId=self.spreadsheet_id,
             range=range_name,
             valueInputOption='USER_ENTERED',
-            body={'values': values}
-        ).execute()
-
-    def _append_values(self, range_name: str, values: List[List[Any]]):
-        """Append values to a sheet."""
-        self._get_sheet().values().append(
+            body={'values': values},
+            fields=WRITE_REPLY_FIELDS
+        ))
+
+    def _batch_update_values(self, data: List[Dict[str, Any]]):
+        """Update several ranges in one values.batchUpdate.
+        ``data`` is a list of {'range': ..., 'values': ...} entries.
+        """
+        self._invalidate_reads(*(d['range'] for d in data))
+        _execute(self._get_sheet().values().batchUpdate(
             spreadsheetId=self.spreadsheet_id,
-            range=range_name,
-            valueInputOption='USER_ENTERED',
-            insertDataOption='INSERT_ROWS',
-            body={'values': values}
-        ).execute()
+            body={'valueInputOption': 'USER_ENTERED', 'data': data},
+            fields=WRITE_REPLY_FIELDS
+        ))
+
+    def _append_values(self, range_name: str, values: List[List[Any]],
+                       value_input_option: str = 'USER_ENTERED',
+                       written: Optional[List[str]] = None):
+        """Append values to a sheet, APPEND_CHUNK_ROWS rows per request.
+        Returns the API reply of the last request.
+        Pass value_input_option='RAW' for plain data (no formulas or dates
+        to parse) so Sheets stores the cells as-is. If written is given,
+        each request's updatedRange is added to it as soon as it succeeds.
+        """
+        self._invalidate_reads(range_name)
+        result = {}
+        for start in range(0, len(values), APPEND_CHUNK_ROWS):
+            result = _execute(self._get_sheet().values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=range_name,
+                valueInputOption=value_input_option,
+                insertDataOption='INSERT_ROWS',
+                body={'values': values[start:start + APPEND_CHUNK_ROWS]},
+                fields='updates(updatedRange)'
+            ), idempotent=False)
+            if written is not None:
+                written.append(result.get('updates', {}).get('updatedRange', ''))
+        return result
 
     def _clear_range(self, range_name: str):
         """Clear a range."""
-        self._get_sheet().values().clear(
+        self._invalidate_reads(range_name)
+        _execute(self._get_sheet().values().clear(
             spreadsheetId=self.spreadsheet_id,
-            range=range_name
-        ).execute()
+            range=range_name,
+            fields=WRITE_REPLY_FIELDS
+        ))
+
+    def _get_sheet_ids(self) -> Dict[str, int]:
+        """Get {tab title: sheetId}, cached for SHEET_NAMES_TTL seconds."""
+        now = time.monotonic()
+        if self._sheet_ids is None or now - self._sheet_ids_at >= SHEET_NAMES_TTL:
+            result = _execute(self._get_sheet().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties(sheetId,title)'
+            ))
+            self._sheet_ids = {
+                s['properties']['title']: s['properties']['sheetId']
+                for s in result.get('sheets', [])
+            }
+            self._sheet_ids_at = now
+        return self._sheet_ids
+
+    def invalidate_sheet_cache(self):
+        """Forget the cached tab list, e.g. after tabs were edited by hand."""
+        self._sheet_ids = None
 
     def _get_all_sheets(self) -> List[str]:
         """Get all sheet names in the spreadsheet."""
-        result = self._get_sheet().get(spreadsheetId=self.spreadsheet_id).execute()
-        return [s['properties']['title'] for s in result.get('sheets', [])]
+        return list(self._get_sheet_ids())
 
     def _sheet_exists(self, name: str) -> bool:
         """Check if a sheet exists."""
-        return name in self._get_all_sheets()
+        return name in self._get_sheet_ids()
 
     def _create_sheet(self, name: str):
         """Create a new sheet."""
+        self._invalidate_reads()
         request = {'addSheet': {'properties': {'title': name}}}
-        self._get_sheet().batchUpdate(
+        result = _execute(self._get_sheet().batchUpdate(
             spreadsheetId=self.spreadsheet_id,
-            body={'requests': [request]}
-        ).execute()
+            body={'requests': [request]},
+            fields='replies(addSheet(properties(sheetId)))'
+        ))
+        if self._sheet_ids is not None:
+            self._sheet_ids[name] = result['replies'][0]['addSheet']['properties']['sheetId']
 
     def _copy_sheet(self, source_name: str, dest_name: str):
         """Copy a sheet to a new name."""
-        result = self._get_sheet().get(spreadsheetId=self.spreadsheet_id).execute()
-        source_id = None
-        for s in result.get('sheets', []):
-            if s['properties']['title'] == source_name:
-                source_id = s['properties']['sheetId']
-                break
+        self._invalidate_reads()
+        source_id = self._get_sheet_ids().get(source_name)
 
         if source_id is None:
             raise Exception(f"Sheet '{source_name}' not found")
 
-        copy_request = {'destinationSpreadsheetId': self.spreadsheet_id}
-        copy_result = self._get_sheet().sheets().copyTo(
+        # duplicateSheet copies and names the tab in a single request
+        # (copyTo needed a second batchUpdate to rename "Copy of ...");
+        # it goes last, where copyTo used to put it
+        request = {'duplicateSheet': {
+            'sourceSheetId': source_id,
+            'newSheetName': dest_name,
+            'insertSheetIndex': len(self._get_sheet_ids())
+        }}
+        result = _execute(self._get_sheet().batchUpdate(
             spreadsheetId=self.spreadsheet_id,
-            sheetId=source_id,
-            body=copy_request
-        ).execute()
-
-        new_sheet_id = copy_result['sheetId']
-        rename_request = {
-            'updateSheetProperties': {
-                'properties': {'sheetId': new_sheet_id, 'title': dest_name},
-                'fields': 'title'
-            }
+            body={'requests': [request]},
+            fields='replies(duplicateSheet(properties(sheetId)))'
+        ))
+
+        new_sheet_id = result['replies'][0]['duplicateSheet']['properties']['sheetId']
+        if self._sheet_ids is not None:
+            self._sheet_ids[dest_name] = new_sheet_id
+
+    def _bom_index_row(self, uid: str) -> Optional[int]:
+        """Sheet row number of a BOM in BOM_INDEX, or None if not found.
+        Uses the cached {uid: row} map, confirmed with a one-cell read so a
+        row moved by hand is never overwritten; otherwise rescans column A.
+        """
+        row_i = self._bom_index_rows.get(uid) if self._bom_index_rows is not None else None
+        if row_i is not None:
+            cell = self._get_values(f"'BOM_INDEX'!A{row_i}", ttl=0)
+            if cell and cell[0] and str(cell[0][0]) == uid:
+                return row_i
+
+        return self._scan_bom_index_uids().get(uid)
+
+    def _scan_bom_index_uids(self) -> Dict[str, int]:
+        """Read BOM_INDEX uncached and rebuild the {uid: row} map."""
+        data = self._get_bom_index(fresh=True)
+        self._bom_index_rows = {
+            str(row[0]): i for i, row in enumerate(data, start=1) if row and i > 1
         }
-        self._get_sheet().batchUpdate(
-            spreadsheetId=self.spreadsheet_id,
-            body={'requests': [rename_request]}
-        ).execute()
+        return self._bom_index_rows
+
+    def _remember_appended_index_rows(self, result: Dict[str, Any], uids: List[str]):
+        """Record the rows BOM_INDEX appends landed on, from the append reply."""
+        if self._bom_index_rows is None:
+            return
+        match = re.search(r'!\D+(\d+)', result.get('updates', {}).get('updatedRange', ''))
+        if not match or len(uids) > APPEND_CHUNK_ROWS:
+            self._bom_index_rows = None
+            return
+        first = int(match.group(1))
+        for offset, uid in enumerate(uids):
+            self._bom_index_rows[uid] = first + offset
 
     # ============ DEMO DATA ============
 
@@ -197,6 +683,53 @@ class SheetsService:
             ]
         )
 
+    def _get_demo_index_rows(self) -> List[Dict[str, Any]]:
+        """Return demo BOM index rows, built once per service."""
+        if self._demo_index_rows is None:
+            now = datetime.now().isoformat()
+            demo_items = [
+                BOMIndexItem(
+                    uid="BOM-20250215-001",
+                    art_no="1307 HI",
+                    set_no="2609",
+                    season="SUMMER-2025",
+                    buyer="DEMO BUYER",
+                    plan_qty=5000,
+                    combo_count=2,
+                    line_count=2,
+                    status="UNALLOCATED",
+                    created_at=now
+                ),
+                BOMIndexItem(
+                    uid="BOM-20250215-002",
+                    art_no="1405 PQ",
+                    set_no="2610",
+                    season="SUMMER-2025",
+                    buyer="DEMO BUYER",
+                    plan_qty=3000,
+                    combo_count=1,
+                    line_count=1,
+                    status="UNALLOCATED",
+                    created_at=now
+                ),
+            ]
+            self._demo_index_rows = [i.model_dump() for i in demo_items]
+        return self._demo_index_rows
+
+    def _get_demo_dplans(self) -> List[DyeingPlan]:
+        """Return demo Dyeing Plans, built once per service."""
+        if self._demo_dplans is None:
+            self._demo_dplans = [
+                DyeingPlan(
+                    dplan_no="2609 DP",
+                    bom_count=2,
+                    total_qty=8000,
+                    created_at=datetime.now().isoformat(),
+                    created_by="demo_user"
+                )
+            ]
+        return self._demo_dplans
+
     def _get_demo_bom(self, sheet_name: str) -> BOM:
         """Return demo BOM data."""
         return BOM(
@@ -268,20 +801,28 @@ class SheetsService:
             return self._get_demo_master_data().articles
 
         articles = []
-        sheets = self._get_all_sheets()
+        names = [
+            name for name in self._get_all_sheets()
+            if name not in self.SKIP_SHEETS and not name.startswith('_')
+        ]
 
-        for name in sheets:
-            if name in self.SKIP_SHEETS or name.startswith('_'):
-                continue
+        # One batchGet for the header cells of every tab; fall back to
+        # per-tab reads if it fails so a single bad tab is reported alone
+        try:
+            cells = self._batch_get_values(
+                [f"'{name}'!{addr}" for name in names for addr in ARTICLE_HEADER_CELLS]
+            )
+        except Exception:
+            cells = None
 
+        width = len(ARTICLE_HEADER_CELLS)
+        for i, name in enumerate(names):
             try:
-                plan_date = self._get_values(f"'{name}'!T1")
-                plan_qty = self._get_values(f"'{name}'!W2")
-                art_no = self._get_values(f"'{name}'!P2")
-                set_no = self._get_values(f"'{name}'!P3")
-                season = self._get_values(f"'{name}'!O1")
-                buyer = self._get_values(f"'{name}'!W3")
-                remarks = self._get_values(f"'{name}'!O5")
+                if cells is not None:
+                    header_cells = cells[i * width:(i + 1) * width]
+                else:
+                    header_cells = [self._get_values(f"'{name}'!{addr}") for addr in ARTICLE_HEADER_CELLS]
+                plan_date, plan_qty, art_no, set_no, season, buyer, remarks = header_cells
 
                 pd_str = ""
                 if plan_date and plan_date[0]:
@@ -291,7 +832,7 @@ class SheetsService:
                 if plan_qty and plan_qty[0]:
                     try:
                         pq_num = float(plan_qty[0][0])
-                    except:
+                    except ValueError:
                         pass
 
                 articles.append(Article(
@@ -318,21 +859,18 @@ class SheetsService:
         if self.demo_mode:
             return self._get_demo_master_data().components
 
-        data = self._get_values("'MASTER DATA'!A2:A200")
-        components = []
-        for row in data:
-            if row and row[0] and str(row[0]).strip():
-                c = str(row[0]).strip()
-                if c not in components:
-                    components.append(c)
-        return components
+        data = self._get_values(MASTER_RANGES['components'])
+        # dict.fromkeys drops duplicates and keeps first-seen order
+        return list(dict.fromkeys(
+            c for c in (str(row[0]).strip() for row in data if row and row[0]) if c
+        ))
 
     def get_master_articles(self) -> List[MasterArticle]:
         """Get articles from MASTER DATA (Col I, J)."""
         if self.demo_mode:
             return self._get_demo_master_data().master_articles
 
-        data = self._get_values("'MASTER DATA'!I2:J2500")
+        data = self._get_values(MASTER_RANGES['master_articles'])
         articles = []
         seen = set()
 
@@ -354,7 +892,7 @@ class SheetsService:
         if self.demo_mode:
             return self._get_demo_master_data().colors
 
-        data = self._get_values("'MASTER DATA'!C2:E500")
+        data = self._get_values(MASTER_RANGES['colors'])
         colors = []
 
         for row in data:
@@ -372,23 +910,23 @@ class SheetsService:
         if self.demo_mode:
             return self._get_demo_master_data().fabrics
 
-        data = self._get_values("'FABRIC MASTERDATA'!A3:K3200")
+        data = self._get_values(MASTER_RANGES['fabrics'])
         fabrics = []
         seen = set()
 
         for row in data:
-            if len(row) >= 9 and row[8] and str(row[8]).strip():
-                final_item = str(row[8]).strip()
+            if row and row[0] and str(row[0]).strip():
+                final_item = str(row[0]).strip()
                 if final_item in seen:
                     continue
                 seen.add(final_item)
 
-                unit = str(row[10]).strip() if len(row) > 10 and row[10] else "kg"
+                unit = str(row[2]).strip() if len(row) > 2 and row[2] else "kg"
                 avg_roll = 25
-                if len(row) > 9 and row[9]:
+                if len(row) > 1 and row[1]:
                     try:
-                        avg_roll = float(row[9])
-                    except:
+                        avg_roll = float(row[1])
+                    except ValueError:
                         pass
 
                 fabrics.append(FabricQuality(
@@ -404,13 +942,22 @@ class SheetsService:
         if self.demo_mode:
             return self._get_demo_master_data()
 
-        return MasterData(
-            articles=self.get_article_list(),
-            colors=self.get_colors(),
-            components=self.get_components(),
-            master_articles=self.get_master_articles(),
-            fabrics=self.get_fabric_qualities()
-        )
+        # The reference lists are reused for MASTER_DATA_TTL seconds. The
+        # article list is not: it follows the tab list, which picks up tabs
+        # this service creates straight away.
+        now = time.monotonic()
+        if self._master_cache is None or now - self._master_cache[0] >= MASTER_DATA_TTL:
+            # One batchGet for all reference ranges; the getters below then
+            # read them from the read cache instead of one request each
+            self._batch_get_values(list(MASTER_RANGES.values()))
+            self._master_cache = (now, {
+                'colors': self.get_colors(),
+                'components': self.get_components(),
+                'master_articles': self.get_master_articles(),
+                'fabrics': self.get_fabric_qualities(),
+            })
+
+        return MasterData(articles=self.get_article_list(), **self._master_cache[1])
 
     # ============ ARTICLE BOM FUNCTIONS ============
 
@@ -419,17 +966,61 @@ class SheetsService:
         if self.demo_mode:
             return self._get_demo_bom(sheet_name)
 
-        if not self._sheet_exists(sheet_name):
-            raise Exception(f"Sheet not found: {sheet_name}")
+        # Header cells and the BOM body in one request; a missing tab
+        # comes back as a 400 "Unable to parse range"
+        try:
+            values = self._batch_get_values(self._article_ranges(sheet_name))
+        except HttpError as e:
+            if e.resp.status == 400:
+                raise Exception(f"Sheet not found: {sheet_name}")
+            raise
+        return self._parse_article_bom(sheet_name, values)
+
+    def load_all_article_boms(self, sheet_names: List[str]) -> Dict[str, BOM]:
+        """Load several article BOMs with batched reads.
+        All tabs are fetched through one values.batchGet (chunked by
+        _batch_get_values). If that fails, e.g. because one tab is gone,
+        each tab is loaded on its own; tabs that still fail are left out
+        of the result.
+        """
+        if self.demo_mode:
+            return {name: self._get_demo_bom(name) for name in sheet_names}
+
+        width = len(ARTICLE_HEADER_CELLS) + 1
+        try:
+            values = self._batch_get_values(
+                [r for name in sheet_names for r in self._article_ranges(name)]
+            )
+        except Exception:
+            boms = {}
+            for name in sheet_names:
+                try:
+                    boms[name] = self.load_article_bom(name)
+                except Exception:
+                    pass
+            return boms
 
+        return {
+            name: self._parse_article_bom(name, values[i * width:(i + 1) * width])
+            for i, name in enumerate(sheet_names)
+        }
+
+    @staticmethod
+    def _article_ranges(sheet_name: str) -> List[str]:
+        """Ranges read for an article tab: the header cells, then the body."""
+        return [f"'{sheet_name}'!{addr}" for addr in ARTICLE_HEADER_CELLS] + [f"'{sheet_name}'!A16:Y"]
+
+    def _parse_article_bom(self, sheet_name: str, values: List[List[List[Any]]]) -> BOM:
+        """Build a BOM from the values of _article_ranges(sheet_name)."""
+        plan_date, plan_qty, art_no, set_no, season, buyer, remarks, data = values
         header_data = {
-            'art_no': self._get_values(f"'{sheet_name}'!P2"),
-            'set_no': self._get_values(f"'{sheet_name}'!P3"),
-            'season': self._get_values(f"'{sheet_name}'!O1"),
-            'plan_qty': self._get_values(f"'{sheet_name}'!W2"),
-            'buyer': self._get_values(f"'{sheet_name}'!W3"),
-            'plan_date': self._get_values(f"'{sheet_name}'!T1"),
-            'remarks': self._get_values(f"'{sheet_name}'!O5"),
+            'art_no': art_no,
+            'set_no': set_no,
+            'season': season,
+            'plan_qty': plan_qty,
+            'buyer': buyer,
+            'plan_date': plan_date,
+            'remarks': remarks,
         }
 
         header = BOMHeader(
@@ -445,62 +1036,68 @@ class SheetsService:
             pq = header_data['plan_qty']
             if pq and pq[0]:
                 header.plan_qty = float(pq[0][0])
-        except:
+        except ValueError:
             pass
 
         if header_data['plan_date'] and header_data['plan_date'][0]:
             header.plan_date = str(header_data['plan_date'][0][0])
 
-        try:
-            data = self._get_values(f"'{sheet_name}'!A16:Y")
-        except:
-            return BOM(header=header, combos=[])
-
         combos = []
         current_combo = None
 
-        for row in data:
-            if len(row) < 15:
-                continue
-
-            component = str(row[14]) if len(row) > 14 and row[14] else ""
-            fabric_quality = str(row[10]) if len(row) > 10 and row[10] else ""
-            color_id = str(row[7]) if len(row) > 7 and row[7] else ""
-
-            if component.strip() == 'Planning Qnty':
+        # Parse the body column-wise: pad rows to the 25 A:Y columns once,
+        # then classify rows and convert numeric columns a column at a time
+        rows = [row + [''] * (25 - len(row)) for row in data if len(row) >= 15]
+        if not rows:
+            return BOM(header=header, combos=combos)
+
+        arr = np.array(rows, dtype=object)
+        text = arr.astype(str)
+        component = np.char.strip(text[:, 14])
+        fabric_quality = np.char.strip(text[:, 10])
+        is_planning = component == 'Planning Qnty'
+        is_line = ~is_planning & ((fabric_quality != '') | (component != ''))
+        # Lines above the first Planning Qnty row belong to no combo
+        is_line_used = is_line & (np.cumsum(is_planning) > 0)
+        num = {col: _float_col(arr[:, col], is_planning if col == 17 else is_line_used).tolist()
+               for col in (15, 17, 18, 19, 20, 21, 22)}
+        # Back to plain Python str/float before building the models
+        text = text.tolist()
+        component = component.tolist()
+        fabric_quality = fabric_quality.tolist()
+
+        for i in np.flatnonzero(is_planning | is_line).tolist():
+            row = rows[i]
+            if is_planning[i]:
                 if current_combo:
                     combos.append(current_combo)
 
                 current_combo = Combo(
-                    combo_sr_no=int(row[3]) if len(row) > 3 and row[3] else 1,
-                    combo_name=str(row[4]) if len(row) > 4 and row[4] else "",
-                    lot_no=str(row[5]) if len(row) > 5 and row[5] else "",
-                    lot_count=int(row[6]) if len(row) > 6 and row[6] else 1,
-                    color_id=color_id,
-                    color_code=str(row[8]) if len(row) > 8 and row[8] else "",
-                    color_name=str(row[9]) if len(row) > 9 and row[9] else "",
-                    plan_qty=float(row[17]) if len(row) > 17 and row[17] else 0,
+                    combo_sr_no=int(row[3]) if row[3] else 1,
+                    combo_name=text[i][4],
+                    lot_no=text[i][5],
+                    lot_count=int(row[6]) if row[6] else 1,
+                    color_id=text[i][7],
+                    color_code=text[i][8],
+                    color_name=text[i][9],
+                    plan_qty=num[17][i],
                     bom_lines=[]
                 )
             elif current_combo:
-                has_fabric = fabric_quality.strip() != ''
-                has_component = component.strip() != '' and component.strip() != 'Planning Qnty'
-
-                if has_fabric or has_component:
-                    current_combo.bom_lines.append(BOMLine(
-                        fabric_quality=fabric_quality.strip() if has_fabric else "",
-                        plan_rat_gsm=str(row[12]) if len(row) > 12 and row[12] else "",
-                        priority=str(row[13]) if len(row) > 13 and row[13] else "",
-                        component=component.strip() if has_component else "",
-                        avg=float(row[15]) if len(row) > 15 and row[15] else 0,
-                        unit=str(row[16]) if len(row) > 16 and row[16] else "",
-                        extra_pcs=float(row[18]) if len(row) > 18 and row[18] else 0,
-                        wastage_pcs=float(row[19]) if len(row) > 19 and row[19] else 0,
-                        ready_fabric_need=float(row[20]) if len(row) > 20 and row[20] else 0,
-                        shortage=float(row[21]) if len(row) > 21 and row[21] else 0,
-                        greige_fabric_need=float(row[22]) if len(row) > 22 and row[22] else 0,
-                        fc_no=str(row[11]) if len(row) > 11 and row[11] else ""
-                    ))
+                current_combo.bom_lines.append(BOMLine(
+                    fabric_quality=fabric_quality[i],
+                    plan_rat_gsm=text[i][12],
+                    priority=text[i][13],
+                    component=component[i],
+                    avg=num[15][i],
+                    unit=text[i][16],
+                    extra_pcs=num[18][i],
+                    wastage_pcs=num[19][i],
+                    ready_fabric_need=num[20][i],
+                    shortage=num[21][i],
+                    greige_fabric_need=num[22][i],
+                    fc_no=text[i][11]
+                ))
 
         if current_combo:
             combos.append(current_combo)
@@ -526,33 +1123,66 @@ class SheetsService:
     # ============ BOM DATABASE FUNCTIONS ============
 
     def ensure_db_sheets(self):
-        """Create BOM_INDEX, BOM_DATA, DPLAN_INDEX if they don't exist."""
+        """Create BOM_INDEX, BOM_DATA, DPLAN_INDEX if they don't exist.
+        Once per process, the header row of sheets that already exist is
+        also extended in place when the schema has gained columns.
+        """
         if self.demo_mode:
             return
 
-        schemas = {
-            'BOM_INDEX': [
-                'BOM_UID', 'ART_NO', 'SET_NO', 'SEASON', 'BUYER', 'PLAN_DATE', 'PLAN_QTY',
-                'REMARKS', 'COMBO_COUNT', 'LINE_COUNT', 'STATUS', 'DPLAN_NO', 'SHEET_NAME',
-                'CREATED_AT', 'UPDATED_AT', 'CREATED_BY'
-            ],
-            'BOM_DATA': [
-                'BOM_UID', 'ROW_TYPE', 'COMBO_SR_NO', 'COMBO_NAME', 'LOT_NO', 'LOT_COUNT',
-                'COLOR_ID', 'COLOR_CODE', 'COLOR_NAME', 'PLAN_QTY',
-                'FABRIC_QUALITY', 'FC_NO', 'PLAN_RAT_GSM', 'PRIORITY', 'COMPONENT', 'AVG', 'UNIT',
-                'EXTRA_PCT', 'WASTAGE_PCT', 'SHORTAGE_PCT',
-                'READY_FABRIC_NEED', 'GREIGE_FABRIC_NEED', 'NO_OF_ROLLS',
-                'GREIGE_IS_MANUAL', 'LINE_ORDER'
-            ],
-            'DPLAN_INDEX': [
-                'DPLAN_NO', 'BOM_COUNT', 'TOTAL_QTY', 'CREATED_AT', 'CREATED_BY', 'NOTES'
-            ]
-        }
+        if not self._db_headers_checked:
+            self._extend_db_headers()
+            self._db_headers_checked = True
 
-        for name, headers in schemas.items():
-            if not self._sheet_exists(name):
-                self._create_sheet(name)
-                self._update_values(f"'{name}'!A1", [headers])
+        missing = [(name, headers) for name, headers in DB_SHEET_SCHEMAS if not self._sheet_exists(name)]
+        if not missing:
+            return
+
+        self._invalidate_reads()
+        result = _execute(self._get_sheet().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': [{'addSheet': {'properties': {'title': name}}} for name, _ in missing]},
+            fields='replies(addSheet(properties(sheetId)))'
+        ))
+        for (name, _), reply in zip(missing, result.get('replies', [])):
+            self._sheet_ids[name] = reply['addSheet']['properties']['sheetId']
+
+        _execute(self._get_sheet().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={
+                'valueInputOption': 'USER_ENTERED',
+                'data': [{'range': f"'{name}'!A1", 'values': [list(headers)]} for name, headers in missing]
+            },
+            fields=WRITE_REPLY_FIELDS
+        ))
+
+    def _extend_db_headers(self):
+        """Append schema columns missing from the end of existing DB sheets'
+        header rows (e.g. TOTAL_READY_KG / TOTAL_GREIGE_KG on an older
+        BOM_INDEX). Existing header cells are written back unchanged.
+        """
+        existing = [(name, headers) for name, headers in DB_SHEET_SCHEMAS if self._sheet_exists(name)]
+        if not existing:
+            return
+        current = self._batch_get_values([f"'{name}'!1:1" for name, _ in existing])
+        short = {}
+        for (name, headers), values in zip(existing, current):
+            row = list(values[0]) if values else []
+            if len(row) < len(headers):
+                short[name] = row + list(headers[len(row):])
+        if not short:
+            return
+
+        self._invalidate_reads()
+        _execute(self._get_sheet().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={
+                'valueInputOption': 'USER_ENTERED',
+                'data': [{'range': f"'{name}'!A1", 'values': [row]} for name, row in short.items()]
+            },
+            fields=WRITE_REPLY_FIELDS
+        ))
+        logger.info(f"Extended header row of {', '.join(short)}")
 
     def generate_bom_uid(self) -> str:
         """Generate a unique BOM ID: BOM-YYYYMMDD-NNN."""
@@ -563,44 +1193,21 @@ class SheetsService:
         if self.demo_mode:
             return f"{prefix}001"
 
-        try:
-            data = self._get_values("'BOM_INDEX'!A:A")
-            max_seq = 0
-            for row in data[1:]:
-                if row and str(row[0]).startswith(prefix):
-                    try:
-                        seq = int(str(row[0])[len(prefix):])
-                        if seq > max_seq:
-                            max_seq = seq
-                    except:
-                        pass
-            return f"{prefix}{str(max_seq + 1).zfill(3)}"
-        except:
-            return f"{prefix}001"
-
-    def save_bom_full(self, uid: Optional[str], header: BOMHeader, combos: List[Combo]) -> Dict[str, Any]:
-        """Save BOM to database sheets and article tab."""
-        if self.demo_mode:
-            new_uid = uid or self.generate_bom_uid()
-            return {
-                "success": True,
-                "uid": new_uid,
-                "message": f"BOM {new_uid} saved (DEMO MODE - not actually saved)",
-                "demo": True
-            }
-
-        self.ensure_db_sheets()
-
-        is_edit = uid is not None
-        if not is_edit:
-            uid = self.generate_bom_uid()
-
-        now = datetime.now().isoformat()
-        user = "webapp_user"
+        # The same read refreshes the uid -> row map used by edits. A failed
+        # read propagates: falling back to 001 would hand out a duplicate UID.
+        seqs = [uid[len(prefix):] for uid in self._scan_bom_index_uids() if uid.startswith(prefix)]
+        max_seq = max((int(seq) for seq in seqs if seq.isdigit()), default=0)
+        return f"{prefix}{str(max_seq + 1).zfill(3)}"
 
+    def _build_index_row(self, uid: str, header: BOMHeader, combos: List[Combo],
+                         now: str, user: str, is_edit: bool) -> List[Any]:
+        """Build the BOM_INDEX row for a recomputed BOM."""
         total_lines = sum(len(c.bom_lines) for c in combos)
+        kg_lines = [line for c in combos for line in c.bom_lines if line.unit == 'kg']
+        total_ready_kg = sum(line.ready_fabric_need for line in kg_lines)
+        total_greige_kg = sum(line.greige_fabric_need for line in kg_lines)
 
-        index_row = [
+        return [
             uid,
             header.art_no or "",
             header.set_no or "",
@@ -616,26 +1223,20 @@ class SheetsService:
             header.art_no or uid,
             now if not is_edit else "",
             now,
-            user if not is_edit else ""
+            user if not is_edit else "",
+            total_ready_kg,
+            total_greige_kg
         ]
 
-        if is_edit:
-            data = self._get_values("'BOM_INDEX'!A:A")
-            for i, row in enumerate(data):
-                if row and str(row[0]) == uid:
-                    self._update_values(f"'BOM_INDEX'!A{i+1}:P{i+1}", [index_row])
-                    break
-        else:
-            self._append_values("'BOM_INDEX'!A:P", [index_row])
-
+    def _build_data_rows(self, uid: str, combos: List[Combo]) -> List[List[Any]]:
+        """Build the BOM_DATA rows (planning + line rows) for a recomputed BOM."""
         new_rows = []
         line_order = 0
 
         for c_idx, combo in enumerate(combos):
             line_order += 1
-
-            new_rows.append([
-                uid, 'PLANNING',
+            # Combo columns C:I are the same on every row of the combo
+            combo_cols = [
                 combo.combo_sr_no or (c_idx + 1),
                 combo.combo_name or "",
                 combo.lot_no or "",
@@ -643,6 +1244,11 @@ class SheetsService:
                 combo.color_id or "",
                 combo.color_code or "",
                 combo.color_name or "",
+            ]
+            line_prefix = [uid, 'BOM_LINE', *combo_cols, '']
+
+            new_rows.append([
+                uid, 'PLANNING', *combo_cols,
                 combo.plan_qty or 0,
                 '', '', '', '', 'Planning Qnty', '', '',
                 '', '', '',
@@ -652,46 +1258,62 @@ class SheetsService:
 
             for line in combo.bom_lines:
                 line_order += 1
-                extra_pct = line.extra_pcs or 0
-                waste_pct = line.wastage_pcs or 0
-                short_pct = line.shortage or 0
-                avg_val = line.avg or 0
-                order_qty = combo.plan_qty or 0
-
-                ready_need = (order_qty + order_qty * extra_pct + order_qty * waste_pct) * avg_val
-                is_manual_greige = line.unit == 'Pcs' and line.greige_fabric_need
-                greige_need = line.greige_fabric_need if is_manual_greige else ready_need * (1 + short_pct)
-                rolls = greige_need / 25 if line.unit == 'kg' else ""
-
-                new_rows.append([
-                    uid, 'BOM_LINE',
-                    combo.combo_sr_no or (c_idx + 1),
-                    combo.combo_name or "",
-                    combo.lot_no or "",
-                    combo.lot_count or 1,
-                    combo.color_id or "",
-                    combo.color_code or "",
-                    combo.color_name or "",
-                    '',
+                rolls = line.no_of_rolls if line.no_of_rolls is not None else ""
+
+                new_rows.append(line_prefix + [
                     line.fabric_quality or "",
                     line.fc_no or "",
                     line.plan_rat_gsm or "",
                     line.priority or "",
                     line.component or "",
-                    avg_val,
+                    line.avg or 0,
                     line.unit or "",
-                    extra_pct,
-                    waste_pct,
-                    short_pct,
-                    ready_need,
-                    greige_need,
+                    line.extra_pcs or 0,
+                    line.wastage_pcs or 0,
+                    line.shortage or 0,
+                    line.ready_fabric_need,
+                    line.greige_fabric_need,
                     rolls,
-                    is_manual_greige,
+                    line.greige_is_manual,
                     line_order
                 ])
 
+        return new_rows
+
+    def save_bom_full(self, uid: Optional[str], header: BOMHeader, combos: List[Combo]) -> Dict[str, Any]:
+        """Save BOM to database sheets and article tab."""
+        if self.demo_mode:
+            new_uid = uid or self.generate_bom_uid()
+            return {
+                "success": True,
+                "uid": new_uid,
+                "message": f"BOM {new_uid} saved (DEMO MODE - not actually saved)",
+                "demo": True
+            }
+
+        self.ensure_db_sheets()
+
+        is_edit = uid is not None
+        if not is_edit:
+            uid = self.generate_bom_uid()
+
+        now = datetime.now().isoformat()
+        user = "webapp_user"
+
+        recompute_bom(combos)
+        index_row = self._build_index_row(uid, header, combos, now, user, is_edit)
+
+        if is_edit:
+            row_i = self._bom_index_row(uid)
+            if row_i is not None:
+                self._update_values(f"'BOM_INDEX'!A{row_i}:R{row_i}", [index_row])
+        else:
+            result = self._append_values("'BOM_INDEX'!A:R", [index_row])
+            self._remember_appended_index_rows(result, [uid])
+
+        new_rows = self._build_data_rows(uid, combos)
         if new_rows:
-            self._append_values("'BOM_DATA'!A:Y", new_rows)
+            self._append_values(BOM_DATA_RANGE, new_rows, 'RAW')
 
         tab_result = None
         try:
@@ -719,17 +1341,13 @@ class SheetsService:
             else:
                 self._create_sheet(sheet_name)
 
+        data = []
         if header.art_no:
-            self._update_values(f"'{sheet_name}'!P2", [[header.art_no]])
+            data.append({'range': f"'{sheet_name}'!P2", 'values': [[header.art_no]]})
         if header.plan_date:
-            self._update_values(f"'{sheet_name}'!T1", [[header.plan_date]])
+            data.append({'range': f"'{sheet_name}'!T1", 'values': [[header.plan_date]]})
         if header.remarks:
-            self._update_values(f"'{sheet_name}'!O5", [[header.remarks]])
-
-        try:
-            self._clear_range(f"'{sheet_name}'!A16:Y1000")
-        except:
-            pass
+            data.append({'range': f"'{sheet_name}'!O5", 'values': [[header.remarks]]})
 
         set_no = header.set_no or ""
         buyer = header.buyer or ""
@@ -759,162 +1377,102 @@ class SheetsService:
 
             rows.append([''] * 25)
 
-        if rows:
-            self._update_values(f"'{sheet_name}'!A16:Y{15 + len(rows)}", rows)
+        # Header and body go out in one write; only the rows of the old
+        # A16:Y1000 body below the new data are cleared afterwards, rather
+        # than sending them as blank padding
+        data.append({'range': f"'{sheet_name}'!A16:Y{15 + len(rows)}", 'values': rows})
+        self._batch_update_values(data)
+        if len(rows) < TAB_BODY_ROWS:
+            self._clear_range(f"'{sheet_name}'!A{16 + len(rows)}:Y{15 + TAB_BODY_ROWS}")
 
     def load_bom_by_uid(self, uid: str) -> BOM:
-        """Load full BOM from database by UID."""
+        """Load full BOM from database by UID.
+        Rows in BOM_INDEX / BOM_DATA are written by save_bom_full and every
+        cell is converted to its field type below, so models are built with
+        model_construct() and skip validation.
+        """
         if self.demo_mode:
             return self._get_demo_bom("DEMO-" + uid)
 
         self.ensure_db_sheets()
 
-        index_data = self._get_values("'BOM_INDEX'!A:P")
+        # With neither sheet cached, BOM_INDEX and BOM_DATA come back from one
+        # batchGet. BOM_INDEX is then unformatted too, which _index_row_dict
+        # converts the same way; its dates are still formatted strings.
+        index_data = self._cached_values(BOM_INDEX_RANGE)
+        if index_data is None:
+            index_data = self._cached_values(BOM_INDEX_RANGE, 'UNFORMATTED_VALUE')
+        if index_data is None:
+            if self._cached_values(BOM_DATA_RANGE, 'UNFORMATTED_VALUE') is None:
+                index_data, _ = self._batch_get_values([BOM_INDEX_RANGE, BOM_DATA_RANGE], render='UNFORMATTED_VALUE')
+            else:
+                index_data = self._get_bom_index()
         header = None
 
         for row in index_data[1:]:
             if row and str(row[0]) == uid:
-                header = BOMHeader(
-                    uid=str(row[0]),
-                    art_no=str(row[1]) if len(row) > 1 else "",
-                    set_no=str(row[2]) if len(row) > 2 else "",
-                    season=str(row[3]) if len(row) > 3 else "",
-                    buyer=str(row[4]) if len(row) > 4 else "",
-                    plan_date=str(row[5]) if len(row) > 5 else "",
-                    plan_qty=float(row[6]) if len(row) > 6 and row[6] else 0,
-                    remarks=str(row[7]) if len(row) > 7 else "",
-                    combo_count=int(row[8]) if len(row) > 8 and row[8] else 0,
-                    line_count=int(row[9]) if len(row) > 9 and row[9] else 0,
-                    status=str(row[10]) if len(row) > 10 else "UNALLOCATED",
-                    dplan_no=str(row[11]) if len(row) > 11 else "",
-                    sheet_name=str(row[12]) if len(row) > 12 else "",
-                    created_at=str(row[13]) if len(row) > 13 else "",
-                    updated_at=str(row[14]) if len(row) > 14 else "",
-                    created_by=str(row[15]) if len(row) > 15 else ""
-                )
+                # The row may come from an unformatted read
+                fields = _index_row_dict([str(cell) for cell in row])
+                if len(row) <= 10:
+                    fields['status'] = "UNALLOCATED"
+                header = BOMHeader.model_construct(**fields)
                 break
 
         if not header:
             raise Exception(f"BOM not found: {uid}")
 
-        data = self._get_values("'BOM_DATA'!A:Y")
         combos = []
         current_combo = None
 
-        for row in data[1:]:
-            if not row or str(row[0]) != uid:
-                continue
+        for row in self._bom_data_rows(uid):
+            row = _pad(row, DATA_COLS)
+            row_type = row[1]
 
-            if str(row[1]) == 'PLANNING':
+            if row_type == 'PLANNING':
                 if current_combo:
                     combos.append(current_combo)
-                current_combo = Combo(
-                    combo_sr_no=int(row[2]) if len(row) > 2 and row[2] else 1,
-                    combo_name=str(row[3]) if len(row) > 3 else "",
-                    lot_no=str(row[4]) if len(row) > 4 else "",
-                    lot_count=int(row[5]) if len(row) > 5 and row[5] else 1,
-                    color_id=str(row[6]) if len(row) > 6 else "",
-                    color_code=str(row[7]) if len(row) > 7 else "",
-                    color_name=str(row[8]) if len(row) > 8 else "",
-                    plan_qty=float(row[9]) if len(row) > 9 and row[9] else 0,
-                    bom_lines=[]
-                )
-            elif str(row[1]) == 'BOM_LINE' and current_combo:
-                current_combo.bom_lines.append(BOMLine(
-                    fabric_quality=str(row[10]) if len(row) > 10 else "",
-                    fc_no=str(row[11]) if len(row) > 11 else "",
-                    plan_rat_gsm=str(row[12]) if len(row) > 12 else "",
-                    priority=str(row[13]) if len(row) > 13 else "",
-                    component=str(row[14]) if len(row) > 14 else "",
-                    avg=float(row[15]) if len(row) > 15 and row[15] else 0,
-                    unit=str(row[16]) if len(row) > 16 else "",
-                    extra_pcs=float(row[17]) if len(row) > 17 and row[17] else 0,
-                    wastage_pcs=float(row[18]) if len(row) > 18 and row[18] else 0,
-                    shortage=float(row[19]) if len(row) > 19 and row[19] else 0,
-                    ready_fabric_need=float(row[20]) if len(row) > 20 and row[20] else 0,
-                    greige_fabric_need=float(row[21]) if len(row) > 21 and row[21] else 0,
-                    no_of_rolls=float(row[22]) if len(row) > 22 and row[22] else None,
-                    greige_is_manual=bool(row[23]) if len(row) > 23 else False
-                ))
+                current_combo = _combo_from_row(row)
+            elif row_type == 'BOM_LINE' and current_combo:
+                current_combo.bom_lines.append(_bom_line_from_row(row))
 
         if current_combo:
             combos.append(current_combo)
 
-        return BOM(header=header, combos=combos)
+        return BOM.model_construct(header=header, combos=combos)
 
-    def load_bom_index(self, status: Optional[str] = None, dplan_no: Optional[str] = None) -> List[BOMIndexItem]:
-        """Load BOM index with optional filtering."""
+    def load_bom_index_rows(self, status: Optional[str] = None, dplan_no: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Load BOM index rows as plain dicts keyed like BOMIndexItem.
+        Used by the listing endpoint, which serializes rows directly
+        instead of building a model per row.
+        """
         if self.demo_mode:
-            demo_items = [
-                BOMIndexItem(
-                    uid="BOM-20250215-001",
-                    art_no="1307 HI",
-                    set_no="2609",
-                    season="SUMMER-2025",
-                    buyer="DEMO BUYER",
-                    plan_qty=5000,
-                    combo_count=2,
-                    line_count=2,
-                    status="UNALLOCATED",
-                    created_at=datetime.now().isoformat()
-                ),
-                BOMIndexItem(
-                    uid="BOM-20250215-002",
-                    art_no="1405 PQ",
-                    set_no="2610",
-                    season="SUMMER-2025",
-                    buyer="DEMO BUYER",
-                    plan_qty=3000,
-                    combo_count=1,
-                    line_count=1,
-                    status="UNALLOCATED",
-                    created_at=datetime.now().isoformat()
-                ),
-            ]
-            if status:
-                demo_items = [i for i in demo_items if i.status == status]
-            return demo_items
+            return [dict(row) for row in self._get_demo_index_rows()
+                    if not status or row['status'] == status]
 
         self.ensure_db_sheets()
 
         try:
-            data = self._get_values("'BOM_INDEX'!A:P")
-        except:
+            data = self._bom_index_for_dplan(dplan_no) if dplan_no else self._get_bom_index()
+        except HttpError as e:
+            logger.warning("Could not read BOM_INDEX: %s", e)
             return []
 
-        results = []
-        for row in data[1:]:
-            if not row:
-                continue
-
-            row_status = str(row[10]) if len(row) > 10 else ""
-            row_dplan = str(row[11]) if len(row) > 11 else ""
-
-            if status and row_status != status:
-                continue
-            if dplan_no and row_dplan != dplan_no:
-                continue
+        rows = data[1:]
+        if status or dplan_no:
+            # Filter on the STATUS / DPLAN_NO columns before converting rows
+            status_col, dplan_col = self._bom_index_filter_cols(data)
+            mask = np.ones(len(rows), dtype=bool)
+            if status:
+                mask &= status_col == status
+            if dplan_no:
+                mask &= dplan_col == dplan_no
+            rows = [rows[i] for i in np.flatnonzero(mask)]
 
-            results.append(BOMIndexItem(
-                uid=str(row[0]) if row else "",
-                art_no=str(row[1]) if len(row) > 1 else "",
-                set_no=str(row[2]) if len(row) > 2 else "",
-                season=str(row[3]) if len(row) > 3 else "",
-                buyer=str(row[4]) if len(row) > 4 else "",
-                plan_date=str(row[5]) if len(row) > 5 else "",
-                plan_qty=float(row[6]) if len(row) > 6 and row[6] else 0,
-                remarks=str(row[7]) if len(row) > 7 else "",
-                combo_count=int(row[8]) if len(row) > 8 and row[8] else 0,
-                line_count=int(row[9]) if len(row) > 9 and row[9] else 0,
-                status=row_status,
-                dplan_no=row_dplan,
-                sheet_name=str(row[12]) if len(row) > 12 else "",
-                created_at=str(row[13]) if len(row) > 13 else "",
-                updated_at=str(row[14]) if len(row) > 14 else "",
-                created_by=str(row[15]) if len(row) > 15 else ""
-            ))
+        return [_index_row_dict(row) for row in rows if row]
 
-        return results
+    def load_bom_index(self, status: Optional[str] = None, dplan_no: Optional[str] = None) -> List[BOMIndexItem]:
+        """Load BOM index with optional filtering."""
+        return [BOMIndexItem.model_construct(**r) for r in self.load_bom_index_rows(status=status, dplan_no=dplan_no)]
 
     def allocate_boms(self, uids: List[str], dplan_no: str) -> Dict[str, Any]:
         """Assign BOMs to a Dyeing Plan."""
@@ -931,28 +1489,39 @@ class SheetsService:
         now = datetime.now().isoformat()
         user = "webapp_user"
 
-        data = self._get_values("'BOM_INDEX'!A:P")
+        # BOM_INDEX and the DPLAN column don't depend on each other, so both
+        # come back from one batchGet, never from the read cache: the rows
+        # found here are the ones written to
+        data, dplan_data = self._batch_get_values([BOM_INDEX_RANGE, "'DPLAN_INDEX'!A:A"])
         allocated = 0
         total_qty = 0
+        updates = []
 
+        uid_set = set(uids)
         for i, row in enumerate(data[1:], start=2):
-            if row and str(row[0]) in uids:
-                self._update_values(f"'BOM_INDEX'!K{i}", [['ALLOCATED']])
-                self._update_values(f"'BOM_INDEX'!L{i}", [[dplan_no]])
-                self._update_values(f"'BOM_INDEX'!O{i}", [[now]])
+            if row and str(row[0]) in uid_set:
+                updates.append({'range': f"'BOM_INDEX'!K{i}:L{i}", 'values': [['ALLOCATED', dplan_no]]})
+                updates.append({'range': f"'BOM_INDEX'!O{i}", 'values': [[now]]})
                 allocated += 1
                 total_qty += float(row[6]) if len(row) > 6 and row[6] else 0
 
-        dplan_data = self._get_values("'DPLAN_INDEX'!A:A")
-        dplan_exists = False
+        # An existing plan's DPLAN_INDEX row goes out in the same
+        # batchUpdate. A new plan is appended: column A alone cannot tell
+        # where the table ends, since a row may be blank there.
+        dplan_row = None
 
         for i, row in enumerate(dplan_data[1:], start=2):
             if row and str(row[0]) == dplan_no:
-                self._update_values(f"'DPLAN_INDEX'!B{i}:C{i}", [[allocated, total_qty]])
-                dplan_exists = True
+                dplan_row = i
                 break
 
-        if not dplan_exists:
+        if dplan_row is not None:
+            updates.append({'range': f"'DPLAN_INDEX'!B{dplan_row}:C{dplan_row}",
+                            'values': [[allocated, total_qty]]})
+
+        if updates:
+            self._batch_update_values(updates)
+        if dplan_row is None:
             self._append_values("'DPLAN_INDEX'!A:F", [[dplan_no, allocated, total_qty, now, user, '']])
 
         return {
@@ -970,49 +1539,48 @@ class SheetsService:
         self.ensure_db_sheets()
 
         now = datetime.now().isoformat()
-        data = self._get_values("'BOM_INDEX'!A:P")
+        data = self._get_bom_index(fresh=True)
         unallocated = 0
 
+        updates = []
+
+        uid_set = set(uids)
         for i, row in enumerate(data[1:], start=2):
-            if row and str(row[0]) in uids:
-                self._update_values(f"'BOM_INDEX'!K{i}", [['UNALLOCATED']])
-                self._update_values(f"'BOM_INDEX'!L{i}", [['']])
-                self._update_values(f"'BOM_INDEX'!O{i}", [[now]])
+            if row and str(row[0]) in uid_set:
+                updates.append({'range': f"'BOM_INDEX'!K{i}:L{i}", 'values': [['UNALLOCATED', '']]})
+                updates.append({'range': f"'BOM_INDEX'!O{i}", 'values': [[now]]})
                 unallocated += 1
 
+        if updates:
+            self._batch_update_values(updates)
+
         return {"success": True, "unallocated": unallocated}
 
     def load_dplans(self) -> List[DyeingPlan]:
         """Load all Dyeing Plans."""
         if self.demo_mode:
-            return [
-                DyeingPlan(
-                    dplan_no="2609 DP",
-                    bom_count=2,
-                    total_qty=8000,
-                    created_at=datetime.now().isoformat(),
-                    created_by="demo_user"
-                )
-            ]
+            return list(self._get_demo_dplans())
 
         self.ensure_db_sheets()
 
         try:
             data = self._get_values("'DPLAN_INDEX'!A:F")
-        except:
+        except HttpError as e:
+            logger.warning("Could not read DPLAN_INDEX: %s", e)
             return []
 
         plans = []
         for row in data[1:]:
             if not row:
                 continue
-            plans.append(DyeingPlan(
-                dplan_no=str(row[0]) if row else "",
-                bom_count=int(row[1]) if len(row) > 1 and row[1] else 0,
-                total_qty=float(row[2]) if len(row) > 2 and row[2] else 0,
-                created_at=str(row[3]) if len(row) > 3 else "",
-                created_by=str(row[4]) if len(row) > 4 else "",
-                notes=str(row[5]) if len(row) > 5 else ""
+            dplan, bom_count, total_qty, created_at, created_by, notes = _pad(row, DPLAN_COLS)[:DPLAN_COLS]
+            plans.append(DyeingPlan.model_construct(
+                dplan_no=dplan,
+                bom_count=_num(bom_count, int),
+                total_qty=_num(total_qty),
+                created_at=created_at,
+                created_by=created_by,
+                notes=notes
             ))
 
         return plans
@@ -1031,27 +1599,49 @@ class SheetsService:
 
         articles = self.get_article_list()
 
-        existing_arts = set()
-        try:
-            idx_data = self._get_values("'BOM_INDEX'!B:B")
-            for row in idx_data[1:]:
-                if row and str(row[0]).strip():
-                    existing_arts.add(str(row[0]).strip())
-        except:
-            pass
+        # UIDs are handed out locally and all rows are appended in one
+        # write per sheet instead of a full save_bom_full per article.
+        # generate_bom_uid reads BOM_INDEX uncached; existing_arts is built
+        # from that same read, which it has just put in the read cache.
+        # A failed read propagates rather than leaving existing_arts empty,
+        # which would import every article a second time.
+        first_uid = self.generate_bom_uid()
+        index_data = self._get_bom_index()
+        # A set, not a frozenset: imported articles are added to it below
+        existing_arts = {row[1].strip() for row in index_data[1:] if len(row) > 1}
+        existing_arts.discard('')
 
         imported = 0
         skipped = 0
         errors = 0
+        uid_prefix, _, seq = first_uid.rpartition('-')
+        next_seq = int(seq)
+        now = datetime.now().isoformat()
+        user = "webapp_user"
+        index_rows = []
+        data_rows = []
 
+        pending = []
         for art in articles:
             art_no = art.art_no.strip()
             if art_no in existing_arts:
                 skipped += 1
                 continue
+            pending.append((art, art_no))
+
+        boms = self.load_all_article_boms([art.sheet_name for art, _ in pending])
+
+        for art, art_no in pending:
+            if art_no in existing_arts:
+                skipped += 1
+                continue
+
+            bom = boms.get(art.sheet_name)
+            if bom is None:
+                errors += 1
+                continue
 
             try:
-                bom = self.load_article_bom(art.sheet_name)
                 if not bom.combos:
                     skipped += 1
                     continue
@@ -1060,13 +1650,46 @@ class SheetsService:
                 if not header.art_no:
                     header.art_no = art_no
 
-                self.save_bom_full(None, header, bom.combos)
+                uid = f"{uid_prefix}-{str(next_seq).zfill(3)}"
+                recompute_bom(bom.combos)
+                index_row = self._build_index_row(uid, header, bom.combos, now, user, False)
+                data_rows.extend(self._build_data_rows(uid, bom.combos))
+                index_rows.append(index_row)
+                next_seq += 1
                 imported += 1
                 existing_arts.add(art_no)
             except Exception as e:
                 errors += 1
 
-        pool = self.load_bom_index(status='UNALLOCATED')
+        if index_rows:
+            # BOM_DATA first: index rows are what mark an article imported.
+            # If any append fails, the ranges already written are cleared
+            # again, so a re-run neither skips these articles nor finds
+            # stray data rows under the UIDs it hands out again.
+            written: List[str] = []
+            try:
+                if data_rows:
+                    self._append_values(BOM_DATA_RANGE, data_rows, 'RAW', written)
+                result = self._append_values("'BOM_INDEX'!A:R", index_rows, written=written)
+                self._remember_appended_index_rows(result, [row[0] for row in index_rows])
+            except Exception as e:
+                logger.error(f"BOM auto-import write failed, rolling back {len(written)} ranges: {e}")
+                for range_name in filter(None, written):
+                    try:
+                        self._clear_range(range_name)
+                    except Exception as clear_error:
+                        logger.error(f"Could not clear {range_name}: {clear_error}")
+                errors += imported
+                imported = 0
+                index_rows = []
+
+        # The unallocated pool is the index read above plus the rows just
+        # appended, so it is built here rather than re-reading BOM_INDEX
+        pool = [
+            BOMIndexItem.model_construct(**_index_row_dict(row))
+            for row in index_data[1:] + index_rows
+            if len(row) > 10 and row[10] == 'UNALLOCATED'
+        ]
         return {
             "imported": imported,
             "skipped": skipped,
@@ -1077,11 +1700,17 @@ class SheetsService:
 
 # Singleton instance
 _sheets_service = None
+_sheets_service_lock = threading.Lock()
 
 
 def get_sheets_service() -> SheetsService:
-    """Get singleton sheets service instance."""
+    """Get singleton sheets service instance.
+    Sync FastAPI dependencies run in a thread pool, so first calls can
+    race; the lock makes sure only one service (and OAuth handshake) is built.
+    """
     global _sheets_service
     if _sheets_service is None:
-        _sheets_service = SheetsService()
+        with _sheets_service_lock:
+            if _sheets_service is None:
+                _sheets_service = SheetsService()
     return _sheets_service
@@ -1,10 +1,17 @@
 """Seed initial data into Google Sheets on first run."""
 import json
+import os
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from ..core.security import get_password_hash
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,292 +24,248 @@ def _now():
 
 
 def _json(obj):
+    # Kept on json.dumps: orjson writes compact separators, and these cells
+    # must match the ", " / ": " encoding the rest of the app writes
     return json.dumps(obj, default=str)
 
 
+# Identical for every seeded user, so encoded once at import
+_SECURITY_JSON = _json({"failed_login_attempts": 0, "two_factor_enabled": False, "must_change_password": False})
+_PREFS_JSON = _json({"language": "en", "timezone": "Asia/Kolkata", "date_format": "DD/MM/YYYY", "theme": "light",
+                     "notifications": {"email": True, "in_app": True, "low_stock": True, "orders": True}})
+_EMPTY_LIST = "[]"
+
+# Fields every seeded user / category-tree node shares; rows are built as
+# {**template, <row-specific fields>}
+_USER_TEMPLATE = {
+    "avatar": "", "additional_permissions": _EMPTY_LIST, "denied_permissions": _EMPTY_LIST,
+    "team_id": "", "team_name": "", "manager": "", "assigned_warehouses": _EMPTY_LIST,
+    "status": "active", "security": _SECURITY_JSON, "sessions": _EMPTY_LIST, "invitation": "",
+    "preferences": _PREFS_JSON, "last_login": "", "last_active": "", "login_count": "0",
+    "created_by": "",
+}
+_NODE_TEMPLATE = {"is_active": "True", "deleted_at": ""}
+
+# Static master rows (colours, sizes, UOMs, ...) live in seed_data.json
+with open(os.path.join(os.path.dirname(__file__), "seed_data.json"), "rb") as f:
+    _SEED_DATA = orjson.loads(f.read()) if orjson is not None else json.load(f)
+
+# Column order of each master tab; rows are built as dict(zip(COLS, values))
+_COLOUR_COLS = ("_id", "colour_code", "colour_name", "colour_hex", "rgb_value", "colour_group", "group_name",
+                "is_active", "deleted_at", "created_at", "updated_at")
+_SIZE_COLS = ("_id", "size_code", "size_name", "size_group", "group_name", "numeric_value", "sort_order",
+              "is_active", "deleted_at", "created_at", "updated_at")
+_UOM_COLS = ("_id", "uom_code", "uom_name", "uom_symbol", "uom_group", "group_name", "conversion_to_base",
+             "is_base_uom", "is_active", "deleted_at", "created_at", "updated_at")
+_VARIANT_GROUP_COLS = ("_id", "variant_type", "group_code", "group_name", "description", "sort_order",
+                       "is_active", "created_at", "updated_at")
+_BRAND_COLS = ("_id", "brand_code", "brand_name", "brand_category", "description", "logo_url", "is_active",
+               "deleted_at", "created_by", "created_at", "updated_at")
+_SUPPLIER_COLS = ("_id", "supplier_code", "supplier_name", "supplier_type", "contact_person", "email", "phone",
+                  "address", "city", "state", "country", "pin_code", "gst_number", "pan_number",
+                  "payment_terms", "credit_limit", "bank_details", "is_active", "deleted_at", "created_by",
+                  "created_at", "updated_at")
+_ITEM_TYPE_COLS = ("_id", "type_code", "type_name", "description", "allow_purchase", "allow_sale",
+                   "track_inventory", "require_quality_check", "default_uom", "color_code", "icon",
+                   "sort_order", "is_active", "created_by", "updated_by", "created_at", "updated_at")
+
+_SEED_PASSWORDS = ("Admin@123", "Manager@123", "User@123")
+_seed_hashes = {}
+
+
+def _password_hashes():
+    """bcrypt hashes of the seed passwords, computed once per process.
+    bcrypt releases the GIL, so the three deliberately slow hashes run in
+    parallel threads instead of back to back.
+    """
+    if not _seed_hashes:
+        with ThreadPoolExecutor(max_workers=len(_SEED_PASSWORDS)) as pool:
+            _seed_hashes.update(zip(_SEED_PASSWORDS, pool.map(get_password_hash, _SEED_PASSWORDS)))
+    return _seed_hashes
+
+
 async def seed_all_data(db):
     """Seed all initial data into Google Sheets."""
     logger.info("Seeding initial data...")
 
-    _seed_users(db)
-    _seed_categories(db)
-    _seed_colours(db)
-    _seed_sizes(db)
-    _seed_uoms(db)
-    _seed_variant_groups(db)
-    _seed_brands(db)
-    _seed_suppliers(db)
-    _seed_item_types(db)
+    # Each helper returns rows for the tabs listed with it; every tab is
+    # then written in a single batched request. Tabs that already hold rows
+    # (e.g. after a partial seed) are left alone, and a helper whose tabs
+    # are all filled is not run, so e.g. the bcrypt hashes are skipped too;
+    # count() reads the in-memory cache
+    seeds = (
+        (("_users",), _seed_users),
+        (("_categories", "_sub_categories", "_divisions", "_classes", "_sub_classes"), _seed_categories),
+        (("_colour_master",), _seed_colours),
+        (("_size_master",), _seed_sizes),
+        (("_uom_master",), _seed_uoms),
+        (("_variant_groups",), _seed_variant_groups),
+        (("_brand_master",), _seed_brands),
+        (("_supplier_master",), _seed_suppliers),
+        (("_item_types",), _seed_item_types),
+    )
+    # One timestamp shared by every seeded row
+    now = _now()
+    batches = []
+    for tabs, seed in seeds:
+        empty = {tab for tab in tabs if not db.count(tab)}
+        if empty:
+            batches.extend((tab, rows) for tab, rows in seed(now) if tab in empty)
+    if not batches:
+        logger.info("Seed skipped: data present")
+        return
+    db.insert_many_multi(batches)
+    for tab, rows in batches:
+        logger.info(f"  Seeded {len(rows)} rows into {tab}")
 
     logger.info("Seed data complete")
 
 
-def _seed_users(db):
-    now = _now()
-    security = _json({"failed_login_attempts": 0, "two_factor_enabled": False, "must_change_password": False})
-    prefs = _json({"language": "en", "timezone": "Asia/Kolkata", "date_format": "DD/MM/YYYY", "theme": "light",
-                    "notifications": {"email": True, "in_app": True, "low_stock": True, "orders": True}})
+def _seed_users(now):
+    hashes = _password_hashes()
+    base = {**_USER_TEMPLATE, "created_at": now, "updated_at": now}
 
     users = [
-        {"_id": _id(), "email": "admin@ccpl.com", "password_hash": get_password_hash("Admin@123"),
-         "full_name": "System Admin", "phone": "+91-9999999999", "avatar": "",
+        {**base, "_id": _id(), "email": "admin@ccpl.com", "password_hash": hashes["Admin@123"],
+         "full_name": "System Admin", "phone": "+91-9999999999",
          "role": _json({"name": "Super Admin", "slug": "super-admin", "level": 10}),
-         "additional_permissions": "[]", "denied_permissions": "[]",
-         "effective_permissions": _json(["*"]),
-         "team_id": "", "team_name": "", "manager": "", "assigned_warehouses": "[]",
-         "status": "active", "security": security, "sessions": "[]", "invitation": "",
-         "preferences": prefs, "last_login": "", "last_active": "", "login_count": "0",
-         "created_by": "", "created_at": now, "updated_at": now},
-        {"_id": _id(), "email": "manager@ccpl.com", "password_hash": get_password_hash("Manager@123"),
-         "full_name": "Inventory Manager", "phone": "+91-8888888888", "avatar": "",
+         "effective_permissions": _json(["*"])},
+        {**base, "_id": _id(), "email": "manager@ccpl.com", "password_hash": hashes["Manager@123"],
+         "full_name": "Inventory Manager", "phone": "+91-8888888888",
          "role": _json({"name": "Manager", "slug": "manager", "level": 20}),
-         "additional_permissions": "[]", "denied_permissions": "[]",
-         "effective_permissions": _json(["inventory.view", "inventory.edit", "reports.view"]),
-         "team_id": "", "team_name": "", "manager": "", "assigned_warehouses": "[]",
-         "status": "active", "security": security, "sessions": "[]", "invitation": "",
-         "preferences": prefs, "last_login": "", "last_active": "", "login_count": "0",
-         "created_by": "", "created_at": now, "updated_at": now},
-        {"_id": _id(), "email": "user@ccpl.com", "password_hash": get_password_hash("User@123"),
-         "full_name": "Regular User", "phone": "+91-7777777777", "avatar": "",
+         "effective_permissions": _json(["inventory.view", "inventory.edit", "reports.view"])},
+        {**base, "_id": _id(), "email": "user@ccpl.com", "password_hash": hashes["User@123"],
+         "full_name": "Regular User", "phone": "+91-7777777777",
          "role": _json({"name": "User", "slug": "user", "level": 30}),
-         "additional_permissions": "[]", "denied_permissions": "[]",
-         "effective_permissions": _json(["inventory.view", "reports.view"]),
-         "team_id": "", "team_name": "", "manager": "", "assigned_warehouses": "[]",
-         "status": "active", "security": security, "sessions": "[]", "invitation": "",
-         "preferences": prefs, "last_login": "", "last_active": "", "login_count": "0",
-         "created_by": "", "created_at": now, "updated_at": now},
+         "effective_permissions": _json(["inventory.view", "reports.view"])},
     ]
-    db.insert_many("_users", users)
-    logger.info(f"  Seeded {len(users)} users")
+    return [("_users", users)]
 
 
-def _seed_categories(db):
-    now = _now()
+def _seed_categories(now):
+    base = {**_NODE_TEMPLATE, "created_at": now, "updated_at": now}
     cats = [
-        {"_id": _id(), "category_code": "APRL", "category_name": "Apparel", "description": "Clothing and garments",
-         "path": "APRL", "path_name": "Apparel", "child_count": "3", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "category_code": "FABR", "category_name": "Fabric", "description": "Raw fabric materials",
-         "path": "FABR", "path_name": "Fabric", "child_count": "2", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "category_code": "TRIM", "category_name": "Trims & Accessories", "description": "Buttons, zippers, labels",
-         "path": "TRIM", "path_name": "Trims & Accessories", "child_count": "2", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "category_code": "PACK", "category_name": "Packaging", "description": "Packaging materials",
-         "path": "PACK", "path_name": "Packaging", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
+        {**base, "_id": _id(), "category_code": "APRL", "category_name": "Apparel", "description": "Clothing and garments",
+         "path": "APRL", "path_name": "Apparel", "child_count": "3"},
+        {**base, "_id": _id(), "category_code": "FABR", "category_name": "Fabric", "description": "Raw fabric materials",
+         "path": "FABR", "path_name": "Fabric", "child_count": "2"},
+        {**base, "_id": _id(), "category_code": "TRIM", "category_name": "Trims & Accessories", "description": "Buttons, zippers, labels",
+         "path": "TRIM", "path_name": "Trims & Accessories", "child_count": "2"},
+        {**base, "_id": _id(), "category_code": "PACK", "category_name": "Packaging", "description": "Packaging materials",
+         "path": "PACK", "path_name": "Packaging", "child_count": "0"},
     ]
-    db.insert_many("_categories", cats)
 
     sub_cats = [
-        {"_id": _id(), "sub_category_code": "MENS", "sub_category_name": "Men's Wear", "category_code": "APRL",
+        {**base, "_id": _id(), "sub_category_code": "MENS", "sub_category_name": "Men's Wear", "category_code": "APRL",
          "category_name": "Apparel", "description": "Men's clothing", "path": "APRL/MENS",
-         "path_name": "Apparel > Men's Wear", "child_count": "2", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_category_code": "WMNS", "sub_category_name": "Women's Wear", "category_code": "APRL",
+         "path_name": "Apparel > Men's Wear", "child_count": "2"},
+        {**base, "_id": _id(), "sub_category_code": "WMNS", "sub_category_name": "Women's Wear", "category_code": "APRL",
          "category_name": "Apparel", "description": "Women's clothing", "path": "APRL/WMNS",
-         "path_name": "Apparel > Women's Wear", "child_count": "2", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_category_code": "KIDS", "sub_category_name": "Kids Wear", "category_code": "APRL",
+         "path_name": "Apparel > Women's Wear", "child_count": "2"},
+        {**base, "_id": _id(), "sub_category_code": "KIDS", "sub_category_name": "Kids Wear", "category_code": "APRL",
          "category_name": "Apparel", "description": "Kids clothing", "path": "APRL/KIDS",
-         "path_name": "Apparel > Kids Wear", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_category_code": "WOVN", "sub_category_name": "Woven Fabric", "category_code": "FABR",
+         "path_name": "Apparel > Kids Wear", "child_count": "0"},
+        {**base, "_id": _id(), "sub_category_code": "WOVN", "sub_category_name": "Woven Fabric", "category_code": "FABR",
          "category_name": "Fabric", "description": "Woven fabrics", "path": "FABR/WOVN",
-         "path_name": "Fabric > Woven Fabric", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_category_code": "KNIT", "sub_category_name": "Knit Fabric", "category_code": "FABR",
+         "path_name": "Fabric > Woven Fabric", "child_count": "0"},
+        {**base, "_id": _id(), "sub_category_code": "KNIT", "sub_category_name": "Knit Fabric", "category_code": "FABR",
          "category_name": "Fabric", "description": "Knitted fabrics", "path": "FABR/KNIT",
-         "path_name": "Fabric > Knit Fabric", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_category_code": "BTNS", "sub_category_name": "Buttons", "category_code": "TRIM",
+         "path_name": "Fabric > Knit Fabric", "child_count": "0"},
+        {**base, "_id": _id(), "sub_category_code": "BTNS", "sub_category_name": "Buttons", "category_code": "TRIM",
          "category_name": "Trims & Accessories", "description": "Buttons", "path": "TRIM/BTNS",
-         "path_name": "Trims > Buttons", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_category_code": "ZIPS", "sub_category_name": "Zippers", "category_code": "TRIM",
+         "path_name": "Trims > Buttons", "child_count": "0"},
+        {**base, "_id": _id(), "sub_category_code": "ZIPS", "sub_category_name": "Zippers", "category_code": "TRIM",
          "category_name": "Trims & Accessories", "description": "Zippers", "path": "TRIM/ZIPS",
-         "path_name": "Trims > Zippers", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
+         "path_name": "Trims > Zippers", "child_count": "0"},
     ]
-    db.insert_many("_sub_categories", sub_cats)
 
     divisions = [
-        {"_id": _id(), "division_code": "TOPW", "division_name": "Topwear", "sub_category_code": "MENS",
+        {**base, "_id": _id(), "division_code": "TOPW", "division_name": "Topwear", "sub_category_code": "MENS",
          "sub_category_name": "Men's Wear", "description": "Tops, shirts, t-shirts", "path": "APRL/MENS/TOPW",
-         "path_name": "Apparel > Men's Wear > Topwear", "child_count": "3", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "division_code": "BTMW", "division_name": "Bottomwear", "sub_category_code": "MENS",
+         "path_name": "Apparel > Men's Wear > Topwear", "child_count": "3"},
+        {**base, "_id": _id(), "division_code": "BTMW", "division_name": "Bottomwear", "sub_category_code": "MENS",
          "sub_category_name": "Men's Wear", "description": "Pants, jeans", "path": "APRL/MENS/BTMW",
-         "path_name": "Apparel > Men's Wear > Bottomwear", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "division_code": "DRSS", "division_name": "Dresses", "sub_category_code": "WMNS",
+         "path_name": "Apparel > Men's Wear > Bottomwear", "child_count": "0"},
+        {**base, "_id": _id(), "division_code": "DRSS", "division_name": "Dresses", "sub_category_code": "WMNS",
          "sub_category_name": "Women's Wear", "description": "Dresses", "path": "APRL/WMNS/DRSS",
-         "path_name": "Apparel > Women's Wear > Dresses", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "division_code": "ETHN", "division_name": "Ethnic Wear", "sub_category_code": "WMNS",
+         "path_name": "Apparel > Women's Wear > Dresses", "child_count": "0"},
+        {**base, "_id": _id(), "division_code": "ETHN", "division_name": "Ethnic Wear", "sub_category_code": "WMNS",
          "sub_category_name": "Women's Wear", "description": "Traditional wear", "path": "APRL/WMNS/ETHN",
-         "path_name": "Apparel > Women's Wear > Ethnic Wear", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
+         "path_name": "Apparel > Women's Wear > Ethnic Wear", "child_count": "0"},
     ]
-    db.insert_many("_divisions", divisions)
 
     classes = [
-        {"_id": _id(), "class_code": "TSHT", "class_name": "T-Shirts", "division_code": "TOPW",
+        {**base, "_id": _id(), "class_code": "TSHT", "class_name": "T-Shirts", "division_code": "TOPW",
          "division_name": "Topwear", "description": "T-shirts", "path": "APRL/MENS/TOPW/TSHT",
-         "path_name": "Topwear > T-Shirts", "child_count": "3", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "class_code": "SHRT", "class_name": "Shirts", "division_code": "TOPW",
+         "path_name": "Topwear > T-Shirts", "child_count": "3"},
+        {**base, "_id": _id(), "class_code": "SHRT", "class_name": "Shirts", "division_code": "TOPW",
          "division_name": "Topwear", "description": "Formal/casual shirts", "path": "APRL/MENS/TOPW/SHRT",
-         "path_name": "Topwear > Shirts", "child_count": "2", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
-        {"_id": _id(), "class_code": "JEAN", "class_name": "Jeans", "division_code": "BTMW",
+         "path_name": "Topwear > Shirts", "child_count": "2"},
+        {**base, "_id": _id(), "class_code": "JEAN", "class_name": "Jeans", "division_code": "BTMW",
          "division_name": "Bottomwear", "description": "Denim jeans", "path": "APRL/MENS/BTMW/JEAN",
-         "path_name": "Bottomwear > Jeans", "child_count": "0", "is_active": "True", "deleted_at": "",
-         "created_at": now, "updated_at": now},
+         "path_name": "Bottomwear > Jeans", "child_count": "0"},
     ]
-    db.insert_many("_classes", classes)
 
     sub_classes = [
-        {"_id": _id(), "sub_class_code": "RNCK", "sub_class_name": "Round Neck", "class_code": "TSHT",
+        {**base, "_id": _id(), "sub_class_code": "RNCK", "sub_class_name": "Round Neck", "class_code": "TSHT",
          "class_name": "T-Shirts", "description": "Round neck t-shirts", "path": "APRL/MENS/TOPW/TSHT/RNCK",
-         "path_name": "T-Shirts > Round Neck", "is_active": "True", "deleted_at": "", "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_class_code": "VNCK", "sub_class_name": "V-Neck", "class_code": "TSHT",
+         "path_name": "T-Shirts > Round Neck"},
+        {**base, "_id": _id(), "sub_class_code": "VNCK", "sub_class_name": "V-Neck", "class_code": "TSHT",
          "class_name": "T-Shirts", "description": "V-neck t-shirts", "path": "APRL/MENS/TOPW/TSHT/VNCK",
-         "path_name": "T-Shirts > V-Neck", "is_active": "True", "deleted_at": "", "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_class_code": "POLO", "sub_class_name": "Polo", "class_code": "TSHT",
+         "path_name": "T-Shirts > V-Neck"},
+        {**base, "_id": _id(), "sub_class_code": "POLO", "sub_class_name": "Polo", "class_code": "TSHT",
          "class_name": "T-Shirts", "description": "Polo t-shirts", "path": "APRL/MENS/TOPW/TSHT/POLO",
-         "path_name": "T-Shirts > Polo", "is_active": "True", "deleted_at": "", "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_class_code": "FRML", "sub_class_name": "Formal", "class_code": "SHRT",
+         "path_name": "T-Shirts > Polo"},
+        {**base, "_id": _id(), "sub_class_code": "FRML", "sub_class_name": "Formal", "class_code": "SHRT",
          "class_name": "Shirts", "description": "Formal shirts", "path": "APRL/MENS/TOPW/SHRT/FRML",
-         "path_name": "Shirts > Formal", "is_active": "True", "deleted_at": "", "created_at": now, "updated_at": now},
-        {"_id": _id(), "sub_class_code": "CASL", "sub_class_name": "Casual", "class_code": "SHRT",
+         "path_name": "Shirts > Formal"},
+        {**base, "_id": _id(), "sub_class_code": "CASL", "sub_class_name": "Casual", "class_code": "SHRT",
          "class_name": "Shirts", "description": "Casual shirts", "path": "APRL/MENS/TOPW/SHRT/CASL",
-         "path_name": "Shirts > Casual", "is_active": "True", "deleted_at": "", "created_at": now, "updated_at": now},
+         "path_name": "Shirts > Casual"},
     ]
-    db.insert_many("_sub_classes", sub_classes)
-    logger.info("  Seeded categories (4 + 7 + 4 + 3 + 5)")
+    return [("_categories", cats), ("_sub_categories", sub_cats), ("_divisions", divisions),
+            ("_classes", classes), ("_sub_classes", sub_classes)]
 
 
-def _seed_colours(db):
-    now = _now()
-    colours = [
-        ("BLK", "Black", "#000000"), ("WHT", "White", "#FFFFFF"), ("NVY", "Navy Blue", "#000080"),
-        ("RED", "Red", "#FF0000"), ("GRN", "Green", "#008000"), ("BLU", "Blue", "#0000FF"),
-        ("GRY", "Grey", "#808080"), ("YLW", "Yellow", "#FFFF00"), ("ORG", "Orange", "#FFA500"),
-        ("PNK", "Pink", "#FFC0CB"), ("PRP", "Purple", "#800080"), ("BRN", "Brown", "#8B4513"),
-        ("BGE", "Beige", "#F5F5DC"), ("MAR", "Maroon", "#800000"), ("TEA", "Teal", "#008080"),
-    ]
-    rows = [{"_id": _id(), "colour_code": c, "colour_name": n, "colour_hex": h, "rgb_value": "",
-             "colour_group": "BASIC", "group_name": "Basic Colors", "is_active": "True", "deleted_at": "",
-             "created_at": now, "updated_at": now} for c, n, h in colours]
-    db.insert_many("_colour_master", rows)
-    logger.info(f"  Seeded {len(rows)} colours")
+def _seed_colours(now):
+    rows = [dict(zip(_COLOUR_COLS, (_id(), c, n, h, "", "BASIC", "Basic Colors", "True", "", now, now)))
+            for c, n, h in _SEED_DATA["colours"]]
+    return [("_colour_master", rows)]
 
 
-def _seed_sizes(db):
-    now = _now()
-    sizes = [
-        ("XS", "Extra Small", "ALPHA", 1), ("S", "Small", "ALPHA", 2), ("M", "Medium", "ALPHA", 3),
-        ("L", "Large", "ALPHA", 4), ("XL", "Extra Large", "ALPHA", 5), ("XXL", "2X Large", "ALPHA", 6),
-        ("3XL", "3X Large", "ALPHA", 7),
-        ("28", "28", "NUMERIC", 28), ("30", "30", "NUMERIC", 30), ("32", "32", "NUMERIC", 32),
-        ("34", "34", "NUMERIC", 34), ("36", "36", "NUMERIC", 36), ("38", "38", "NUMERIC", 38),
-        ("40", "40", "NUMERIC", 40),
-    ]
-    rows = [{"_id": _id(), "size_code": c, "size_name": n, "size_group": g, "group_name": g + " Sizes",
-             "numeric_value": str(v), "sort_order": str(v), "is_active": "True", "deleted_at": "",
-             "created_at": now, "updated_at": now} for c, n, g, v in sizes]
-    db.insert_many("_size_master", rows)
-    logger.info(f"  Seeded {len(rows)} sizes")
+def _seed_sizes(now):
+    rows = [dict(zip(_SIZE_COLS, (_id(), c, n, g, g + " Sizes", str(v), str(v), "True", "", now, now)))
+            for c, n, g, v in _SEED_DATA["sizes"]]
+    return [("_size_master", rows)]
 
 
-def _seed_uoms(db):
-    now = _now()
-    uoms = [
-        ("PCS", "Pieces", "PCS", "COUNT", 1, True), ("DOZ", "Dozen", "DOZ", "COUNT", 12, False),
-        ("GRS", "Gross", "GRS", "COUNT", 144, False), ("SET", "Set", "SET", "COUNT", 1, True),
-        ("PAR", "Pair", "PAR", "COUNT", 2, False),
-        ("MTR", "Meters", "m", "LENGTH", 1, True), ("CM", "Centimeters", "cm", "LENGTH", 0.01, False),
-        ("YRD", "Yards", "yd", "LENGTH", 0.9144, False), ("IN", "Inches", "in", "LENGTH", 0.0254, False),
-        ("KG", "Kilograms", "kg", "WEIGHT", 1, True), ("GM", "Grams", "g", "WEIGHT", 0.001, False),
-        ("LB", "Pounds", "lb", "WEIGHT", 0.4536, False),
-        ("SQM", "Square Meters", "sqm", "AREA", 1, True), ("SQFT", "Square Feet", "sqft", "AREA", 0.0929, False),
-    ]
-    rows = [{"_id": _id(), "uom_code": c, "uom_name": n, "uom_symbol": s, "uom_group": g,
-             "group_name": g, "conversion_to_base": str(conv), "is_base_uom": str(base),
-             "is_active": "True", "deleted_at": "", "created_at": now, "updated_at": now}
-            for c, n, s, g, conv, base in uoms]
-    db.insert_many("_uom_master", rows)
-    logger.info(f"  Seeded {len(rows)} UOMs")
+def _seed_uoms(now):
+    rows = [dict(zip(_UOM_COLS, (_id(), c, n, s, g, g, str(conv), str(base), "True", "", now, now)))
+            for c, n, s, g, conv, base in _SEED_DATA["uoms"]]
+    return [("_uom_master", rows)]
 
 
-def _seed_variant_groups(db):
-    now = _now()
-    groups = [
-        ("COLOUR", "BASIC", "Basic Colors", 1), ("COLOUR", "PASTEL", "Pastel Colors", 2),
-        ("COLOUR", "NEON", "Neon Colors", 3), ("COLOUR", "NEUTRAL", "Neutral Colors", 4),
-        ("COLOUR", "DENIM", "Denim Shades", 5),
-        ("SIZE", "ALPHA", "Alpha Sizes", 1), ("SIZE", "NUMERIC", "Numeric Sizes", 2),
-        ("SIZE", "AGE", "Age-based Sizes", 3), ("SIZE", "SHOE", "Shoe Sizes", 4),
-        ("SIZE", "RING", "Ring Sizes", 5),
-        ("UOM", "COUNT", "Counting Units", 1), ("UOM", "LENGTH", "Length Units", 2),
-        ("UOM", "WEIGHT", "Weight Units", 3), ("UOM", "AREA", "Area Units", 4),
-        ("UOM", "VOLUME", "Volume Units", 5),
-    ]
-    rows = [{"_id": _id(), "variant_type": t, "group_code": c, "group_name": n,
-             "description": "", "sort_order": str(s), "is_active": "True",
-             "created_at": now, "updated_at": now} for t, c, n, s in groups]
-    db.insert_many("_variant_groups", rows)
-    logger.info(f"  Seeded {len(rows)} variant groups")
+def _seed_variant_groups(now):
+    rows = [dict(zip(_VARIANT_GROUP_COLS, (_id(), t, c, n, "", str(s), "True", now, now)))
+            for t, c, n, s in _SEED_DATA["variant_groups"]]
+    return [("_variant_groups", rows)]
 
 
-def _seed_brands(db):
-    now = _now()
-    brands = [
-        ("BR-001", "Confidence Clothing", "In-house"), ("BR-002", "Premium Line", "Premium"),
-        ("BR-003", "Urban Edge", "Casual"), ("BR-004", "Classic Fit", "Formal"),
-        ("BR-005", "Active Wear", "Sports"),
-    ]
-    rows = [{"_id": _id(), "brand_code": c, "brand_name": n, "brand_category": cat,
-             "description": "", "logo_url": "", "is_active": "True", "deleted_at": "",
-             "created_by": "", "created_at": now, "updated_at": now} for c, n, cat in brands]
-    db.insert_many("_brand_master", rows)
-    logger.info(f"  Seeded {len(rows)} brands")
+def _seed_brands(now):
+    rows = [dict(zip(_BRAND_COLS, (_id(), c, n, cat, "", "", "True", "", "", now, now)))
+            for c, n, cat in _SEED_DATA["brands"]]
+    return [("_brand_master", rows)]
 
 
-def _seed_suppliers(db):
-    now = _now()
-    suppliers = [
-        ("SUP-001", "Fabric World Textiles", "Manufacturer", "Mumbai"),
-        ("SUP-002", "Global Trims Co.", "Wholesaler", "Delhi"),
-        ("SUP-003", "Quality Threads Ltd.", "Manufacturer", "Surat"),
-        ("SUP-004", "Eastern Dyes & Chemicals", "Distributor", "Ahmedabad"),
-        ("SUP-005", "Premium Packaging", "Wholesaler", "Kolkata"),
-    ]
-    rows = [{"_id": _id(), "supplier_code": c, "supplier_name": n, "supplier_type": t,
-             "contact_person": "", "email": "", "phone": "", "address": "", "city": city,
-             "state": "", "country": "India", "pin_code": "", "gst_number": "", "pan_number": "",
-             "payment_terms": "Net 30", "credit_limit": "100000", "bank_details": "",
-             "is_active": "True", "deleted_at": "", "created_by": "", "created_at": now, "updated_at": now}
-            for c, n, t, city in suppliers]
-    db.insert_many("_supplier_master", rows)
-    logger.info(f"  Seeded {len(rows)} suppliers")
+def _seed_suppliers(now):
+    rows = [dict(zip(_SUPPLIER_COLS, (_id(), c, n, t, "", "", "", "", city, "", "India", "", "", "",
+                                      "Net 30", "100000", "", "True", "", "", now, now)))
+            for c, n, t, city in _SEED_DATA["suppliers"]]
+    return [("_supplier_master", rows)]
 
 
-def _seed_item_types(db):
-    now = _now()
-    types = [
-        ("YN", "Yarn & Fiber", True, False, True), ("GF", "Greige Fabric", True, False, True),
-        ("DF", "Dyed Fabric", True, False, True), ("TR", "Trims & Accessories", True, False, True),
-        ("DY", "Dyes & Chemicals", True, False, True), ("CP", "Cut Panels", False, False, True),
-        ("SF", "Semi Finished", False, False, True), ("FG", "Finished Goods", False, True, True),
-        ("PK", "Packaging", True, False, True), ("CS", "Consumables", True, False, False),
-    ]
-    rows = [{"_id": _id(), "type_code": c, "type_name": n, "description": "",
-             "allow_purchase": str(p), "allow_sale": str(s), "track_inventory": str(inv),
-             "require_quality_check": "False", "default_uom": "PCS", "color_code": "", "icon": "",
-             "sort_order": str(i + 1), "is_active": "True", "created_by": "", "updated_by": "",
-             "created_at": now, "updated_at": now}
-            for i, (c, n, p, s, inv) in enumerate(types)]
-    db.insert_many("_item_types", rows)
-    logger.info(f"  Seeded {len(rows)} item types")
+def _seed_item_types(now):
+    rows = [dict(zip(_ITEM_TYPE_COLS, (_id(), c, n, "", str(p), str(s), str(inv), "False", "PCS", "", "",
+                                       str(i + 1), "True", "", "", now, now)))
+            for i, (c, n, p, s, inv) in enumerate(_SEED_DATA["item_types"])]
+    return [("_item_types", rows)]
@@ -3,12 +3,15 @@ Uses in-memory cache for reads, write-through for mutations.
 """
 import os
 import re
+import random
+import asyncio
+import sys
 import json
 import time
 import uuid
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 
 from ..config import settings
 
@@ -24,6 +27,11 @@ try:
 except ImportError:
     GOOGLE_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from google_auth_oauthlib.flow import InstalledAppFlow
     OAUTH_FLOW_AVAILABLE = True
@@ -33,18 +41,36 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-def _retry_on_rate_limit(func, max_retries=3):
-    """Execute a Google API call with retry on 429 rate limit errors."""
+def _retry_on_rate_limit(func, max_retries=5):
+    """Execute a Google API call with retry on 429 rate limit errors.
+    Honors a Retry-After header; otherwise each wait is drawn at random
+    from a window that doubles per attempt (1s, 2s, 4s ... capped at 32s),
+    so concurrent callers do not retry in lockstep.
+    """
     for attempt in range(max_retries + 1):
         try:
             return func()
         except HttpError as e:
-            if e.resp.status == 429 and attempt < max_retries:
-                wait = 10 * (attempt + 1)  # 10s, 20s, 30s
-                logger.warning(f"Rate limit hit, waiting {wait}s (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait)
-            else:
+            if e.resp.status != 429 or attempt == max_retries:
                 raise
+            retry_after = e.resp.get('retry-after', '')
+            if retry_after.isdigit():
+                wait = float(retry_after)
+            else:
+                wait = random.uniform(0, min(32, 2 ** attempt)) + 0.5
+            logger.warning(f"Rate limit hit, waiting {wait:.1f}s (attempt {attempt + 1}/{max_retries})")
+            time.sleep(wait)
+
+
+def _compile_serializer(headers: List[str]) -> Callable[[Dict], List[str]]:
+    """Build `lambda r: [str(r.get(h0, '')), str(r.get(h1, '')), ...]` for a
+    fixed header list, so serializing a row is one unrolled list display
+    instead of a per-cell loop. Headers are embedded via repr().
+    """
+    cells = ", ".join(f"str(get({h!r}, ''))" for h in headers)
+    namespace: Dict[str, Any] = {}
+    exec(f"def serialize(r):\n    get = r.get\n    return [{cells}]", namespace)
+    return namespace['serialize']
 
 
 class SheetsDBService:
@@ -62,8 +88,16 @@ class SheetsDBService:
         self._cache: Dict[str, List[Dict[str, Any]]] = {}
         # Headers per tab
         self._headers: Dict[str, List[str]] = {}
+        # Row dict -> header-ordered cell list, compiled per tab
+        self._row_serializer: Dict[str, Callable[[Dict], List[str]]] = {}
         # Row number mapping: tab_name -> {_id -> sheet_row_number}
         self._row_map: Dict[str, Dict[str, int]] = {}
+        # Cache position mapping: tab_name -> {_id -> index into _cache[tab_name]}
+        self._id_index: Dict[str, Dict[str, int]] = {}
+        # Tabs already created/checked by ensure_tab in this process
+        self._tabs_ensured: set = set()
+        # Numeric sheetId per tab, needed for row deletes
+        self._sheet_ids: Dict[str, int] = {}
 
     def _init_google(self):
         """Initialize Google Sheets API connection.
@@ -112,8 +146,8 @@ class SheetsDBService:
         if not creds or not creds.valid:
             if os.path.exists(cred_path):
                 try:
-                    with open(cred_path, 'r') as f:
-                        cred_data = json.load(f)
+                    with open(cred_path, 'rb') as f:
+                        cred_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
                     if cred_data.get('type') == 'service_account':
                         creds = service_account.Credentials.from_service_account_file(
                             cred_path, scopes=SCOPES
@@ -145,6 +179,37 @@ class SheetsDBService:
         self.demo_mode = True
         self.error_message = "No valid Google credentials found. Set GOOGLE_API_KEY in .env or provide a service account key."
 
+    def _set_headers(self, tab_name: str, headers: List[str]) -> List[str]:
+        """Record a tab's headers and compile its row serializer.
+        Header names are interned so every cached row dict shares the same
+        key objects and lookups with literal keys compare by identity.
+        """
+        headers = [sys.intern(h) for h in headers]
+        self._headers[tab_name] = headers
+        self._row_serializer[tab_name] = _compile_serializer(headers)
+        return headers
+
+    def _doc_to_row(self, tab_name: str, row_data: Dict) -> List[str]:
+        """Serialize a row dict into a header-ordered list of cell strings."""
+        serialize = self._row_serializer.get(tab_name)
+        return serialize(row_data) if serialize else []
+
+    def _record_sheet_ids(self, meta: Dict):
+        """Remember title -> sheetId from a spreadsheets.get response."""
+        for sheet in meta.get('sheets', []):
+            props = sheet['properties']
+            self._sheet_ids[props['title']] = props['sheetId']
+
+    def _sheet_id(self, tab_name: str, sheets=None) -> int:
+        """sheetId of a tab, re-reading the spreadsheet metadata if unknown."""
+        if tab_name not in self._sheet_ids:
+            sheets = sheets or self._sheets()
+            self._record_sheet_ids(_retry_on_rate_limit(lambda: sheets.get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties(title,sheetId)'
+            ).execute()))
+        return self._sheet_ids[tab_name]
+
     def _sheets(self):
         """Get spreadsheets API resource."""
         if not self.service:
@@ -152,7 +217,14 @@ class SheetsDBService:
         return self.service.spreadsheets()
 
     async def initialize(self):
-        """Initialize the service: connect to Google, load all _-prefixed tabs."""
+        """Initialize the service: connect to Google, load all _-prefixed tabs.
+        The blocking API calls run in a worker thread so startup does not
+        stall the event loop.
+        """
+        await asyncio.to_thread(self._initialize_sync)
+
+    def _initialize_sync(self):
+        """Blocking part of initialize()."""
         self._init_google()
 
         if self.demo_mode:
@@ -161,19 +233,33 @@ class SheetsDBService:
 
         try:
             # Get all sheet tabs
-            meta = self._sheets().get(spreadsheetId=self.spreadsheet_id).execute()
+            meta = self._sheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties(title,sheetId)'
+            ).execute()
+            self._record_sheet_ids(meta)
             sheet_names = [s['properties']['title'] for s in meta.get('sheets', [])]
 
-            # Load all _-prefixed tabs into cache
-            for name in sheet_names:
-                if name.startswith('_'):
-                    self._load_tab(name)
+            # Load all _-prefixed tabs into cache with one batchGet
+            tabs = [name for name in sheet_names if name.startswith('_')]
+            if tabs:
+                for name, rows in self._fetch_tabs(tabs, self._sheets()).items():
+                    self._populate_tab(name, rows)
 
             logger.info(f"SheetsDB loaded {len(self._cache)} tabs into cache")
         except Exception as e:
             logger.error(f"SheetsDB initialization error: {e}")
             raise
 
+    def _fetch_tabs(self, tab_names: List[str], sheets) -> Dict[str, List[List[str]]]:
+        """Read several tabs' values with one batchGet."""
+        result = _retry_on_rate_limit(lambda: sheets.values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=[f"'{name}'!A:ZZ" for name in tab_names]
+        ).execute())
+        return {name: value_range.get('values', [])
+                for name, value_range in zip(tab_names, result.get('valueRanges', []))}
+
     def _load_tab(self, tab_name: str):
         """Load a single tab into the cache."""
         try:
@@ -181,56 +267,69 @@ class SheetsDBService:
                 spreadsheetId=self.spreadsheet_id,
                 range=f"'{tab_name}'!A:ZZ"
             ).execute()
-            rows = result.get('values', [])
-
-            if not rows:
-                self._cache[tab_name] = []
-                self._headers[tab_name] = []
-                self._row_map[tab_name] = {}
-                return
-
-            headers = rows[0]
-            self._headers[tab_name] = headers
-            self._cache[tab_name] = []
-            self._row_map[tab_name] = {}
-
-            for i, row in enumerate(rows[1:], start=2):  # row 2 in sheet
-                row_dict = {}
-                for j, header in enumerate(headers):
-                    row_dict[header] = row[j] if j < len(row) else ''
-                self._cache[tab_name].append(row_dict)
-                doc_id = row_dict.get('_id', '')
-                if doc_id:
-                    self._row_map[tab_name][doc_id] = i
+            self._populate_tab(tab_name, result.get('values', []))
 
         except HttpError as e:
             if e.resp.status == 400:
                 # Tab might not exist yet
-                self._cache[tab_name] = []
-                self._headers[tab_name] = []
-                self._row_map[tab_name] = {}
+                self._populate_tab(tab_name, [])
             else:
                 raise
 
+    def _populate_tab(self, tab_name: str, rows: List[List[str]]):
+        """Build a tab's cache, row map and _id index from its sheet values
+        (header row first).
+        """
+        if not rows:
+            self._cache[tab_name] = []
+            self._set_headers(tab_name, [])
+            self._row_map[tab_name] = {}
+            self._id_index[tab_name] = {}
+            return
+
+        headers = self._set_headers(tab_name, rows[0])
+        width = len(headers)
+        blank = [''] * width
+        # Short rows (trailing empty cells are omitted by the API) are padded
+        # with list ops so dict(zip()) builds each row in C
+        cache = self._cache[tab_name] = [
+            dict(zip(headers, row if len(row) >= width else row + blank[len(row):]))
+            for row in rows[1:]
+        ]
+        row_map = self._row_map[tab_name] = {}
+        ids = self._id_index[tab_name] = {}
+
+        for i, row_dict in enumerate(cache):
+            doc_id = row_dict.get('_id', '')
+            if doc_id:
+                row_map[doc_id] = i + 2  # row 2 in sheet
+                ids[doc_id] = i
+
     def ensure_tab(self, tab_name: str, headers: List[str]):
         """Create tab if it doesn't exist and set headers."""
+        if tab_name in self._tabs_ensured:
+            return
+
         if self.demo_mode:
             # In demo mode, just init empty cache
             if tab_name not in self._cache:
                 self._cache[tab_name] = []
-                self._headers[tab_name] = headers
+                self._set_headers(tab_name, headers)
                 self._row_map[tab_name] = {}
+            self._tabs_ensured.add(tab_name)
             return
 
         if tab_name in self._headers and self._headers[tab_name]:
+            self._tabs_ensured.add(tab_name)
             return  # Already exists with headers
 
         try:
             # Try to create the sheet tab
-            _retry_on_rate_limit(lambda: self._sheets().batchUpdate(
+            result = _retry_on_rate_limit(lambda: self._sheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
                 body={'requests': [{'addSheet': {'properties': {'title': tab_name}}}]}
             ).execute())
+            self._sheet_ids[tab_name] = result['replies'][0]['addSheet']['properties']['sheetId']
             logger.info(f"Created sheet tab: {tab_name}")
         except HttpError as e:
             if 'already exists' not in str(e):
@@ -248,10 +347,11 @@ class SheetsDBService:
         except Exception as e:
             logger.warning(f"Could not write headers for {tab_name}: {e}")
 
-        self._headers[tab_name] = headers
+        self._set_headers(tab_name, headers)
         if tab_name not in self._cache:
             self._cache[tab_name] = []
             self._row_map[tab_name] = {}
+        self._tabs_ensured.add(tab_name)
 
     # ==================== READ OPERATIONS ====================
 
@@ -271,10 +371,19 @@ class SheetsDBService:
 
     def get_by_id(self, tab_name: str, doc_id: str) -> Optional[Dict]:
         """Get a row by its _id."""
-        for row in self._cache.get(tab_name, []):
-            if row.get('_id') == doc_id:
-                return row
-        return None
+        i = self._ids(tab_name).get(doc_id)
+        return self._cache[tab_name][i] if i is not None else None
+
+    def _ids(self, tab_name: str) -> Dict[str, int]:
+        """Return the tab's _id -> cache index map, building it on first
+        use for tabs created without a load.
+        """
+        ids = self._id_index.get(tab_name)
+        if ids is None:
+            ids = self._id_index[tab_name] = {
+                row['_id']: i for i, row in enumerate(self._cache.get(tab_name, [])) if row.get('_id')
+            }
+        return ids
 
     def count(self, tab_name: str, filter_fn: Optional[Callable] = None) -> int:
         """Count matching rows."""
@@ -286,33 +395,10 @@ class SheetsDBService:
 
     def insert(self, tab_name: str, row_data: Dict) -> Dict:
         """Insert a new row. Generates _id if missing."""
-        if '_id' not in row_data or not row_data['_id']:
-            row_data['_id'] = uuid.uuid4().hex
-
-        # Add to cache
-        if tab_name not in self._cache:
-            self._cache[tab_name] = []
-            self._row_map[tab_name] = {}
-
-        self._cache[tab_name].append(row_data)
-        next_row = len(self._cache[tab_name]) + 1  # +1 for header row
-        self._row_map.setdefault(tab_name, {})[row_data['_id']] = next_row
+        sheet_rows = self._cache_new_rows(tab_name, [row_data])
 
-        if not self.demo_mode:
-            # Write to sheet
-            headers = self._headers.get(tab_name, [])
-            if headers:
-                values = [str(row_data.get(h, '')) for h in headers]
-                try:
-                    _retry_on_rate_limit(lambda: self._sheets().values().append(
-                        spreadsheetId=self.spreadsheet_id,
-                        range=f"'{tab_name}'!A:A",
-                        valueInputOption='RAW',
-                        insertDataOption='INSERT_ROWS',
-                        body={'values': [values]}
-                    ).execute())
-                except Exception as e:
-                    logger.error(f"Sheet write error ({tab_name}): {e}")
+        if not self.demo_mode and sheet_rows:
+            self._write([tab_name], lambda: self._append(tab_name, sheet_rows))
 
         return row_data
 
@@ -321,88 +407,137 @@ class SheetsDBService:
         if not rows:
             return []
 
-        headers = self._headers.get(tab_name, [])
-        sheet_rows = []
-
-        for row_data in rows:
-            if '_id' not in row_data or not row_data['_id']:
-                row_data['_id'] = uuid.uuid4().hex
-
-            if tab_name not in self._cache:
-                self._cache[tab_name] = []
-                self._row_map[tab_name] = {}
-
-            self._cache[tab_name].append(row_data)
-            next_row = len(self._cache[tab_name]) + 1
-            self._row_map.setdefault(tab_name, {})[row_data['_id']] = next_row
-
-            if headers:
-                sheet_rows.append([str(row_data.get(h, '')) for h in headers])
+        sheet_rows = self._cache_new_rows(tab_name, rows)
 
         if not self.demo_mode and sheet_rows:
-            try:
-                _retry_on_rate_limit(lambda: self._sheets().values().append(
-                    spreadsheetId=self.spreadsheet_id,
-                    range=f"'{tab_name}'!A:A",
-                    valueInputOption='RAW',
-                    insertDataOption='INSERT_ROWS',
-                    body={'values': sheet_rows}
-                ).execute())
-            except Exception as e:
-                logger.error(f"Sheet batch write error ({tab_name}): {e}")
+            self._write([tab_name], lambda: self._append(tab_name, sheet_rows))
 
         return rows
 
+    def insert_many_multi(self, batches: List[Tuple[str, List[Dict]]]):
+        """Insert rows into several tabs with a single values.batchUpdate.
+        Each tab's rows are written directly below its last cached row,
+        the same position the row map already assigns them. Unlike an
+        append this does not add grid rows, so it suits small batches such
+        as the first-run seed (new tabs have 1000 rows).
+        """
+        tabs = []
+        data = []
+        for tab_name, rows in batches:
+            if not rows:
+                continue
+            first_row = len(self._cache.get(tab_name, [])) + 2  # +1 header, +1 next row
+            sheet_rows = self._cache_new_rows(tab_name, rows)
+            if sheet_rows:
+                tabs.append(tab_name)
+                data.append({'range': f"'{tab_name}'!A{first_row}", 'values': sheet_rows})
+
+        if not self.demo_mode and data:
+            self._write(tabs, lambda: self._write_ranges(data))
+
+    def _cache_new_rows(self, tab_name: str, rows: List[Dict]) -> List[List[str]]:
+        """Add new rows to a tab's cache and row map, assigning missing _ids.
+        Returns the rows serialized for the sheet (empty if the tab has no
+        headers yet).
+        """
+        cache = self._cache.setdefault(tab_name, [])
+        row_map = self._row_map.setdefault(tab_name, {})
+        ids = self._ids(tab_name)
+        start = len(cache)  # cache index of the first new row; sheet row is +2
+
+        for i, row_data in enumerate(rows, start):
+            doc_id = row_data.get('_id')
+            if not doc_id:
+                doc_id = row_data['_id'] = uuid.uuid4().hex
+            ids[doc_id] = i
+            row_map[doc_id] = i + 2
+        cache.extend(rows)
+
+        if not self._headers.get(tab_name):
+            return []
+        serialize = self._row_serializer[tab_name]
+        return [serialize(row_data) for row_data in rows]
+
     def update(self, tab_name: str, doc_id: str, row_data: Dict):
         """Update an existing row by _id."""
         # Update cache
-        rows = self._cache.get(tab_name, [])
-        for i, row in enumerate(rows):
-            if row.get('_id') == doc_id:
-                rows[i] = row_data
-                break
+        i = self._ids(tab_name).get(doc_id)
+        if i is not None:
+            self._cache[tab_name][i] = row_data
 
         if not self.demo_mode:
             # Find sheet row number
             row_num = self._row_map.get(tab_name, {}).get(doc_id)
-            if row_num:
-                headers = self._headers.get(tab_name, [])
-                if headers:
-                    values = [str(row_data.get(h, '')) for h in headers]
-                    try:
-                        _retry_on_rate_limit(lambda: self._sheets().values().update(
-                            spreadsheetId=self.spreadsheet_id,
-                            range=f"'{tab_name}'!A{row_num}",
-                            valueInputOption='RAW',
-                            body={'values': [values]}
-                        ).execute())
-                    except Exception as e:
-                        logger.error(f"Sheet update error ({tab_name}): {e}")
+            if row_num and self._headers.get(tab_name):
+                data = [{'range': f"'{tab_name}'!A{row_num}",
+                         'values': [self._doc_to_row(tab_name, row_data)]}]
+                self._write([tab_name], lambda: self._write_ranges(data))
 
     def delete(self, tab_name: str, doc_id: str):
-        """Delete a row by _id."""
-        rows = self._cache.get(tab_name, [])
-        self._cache[tab_name] = [r for r in rows if r.get('_id') != doc_id]
+        """Delete a row by _id.
+        The sheet row is removed (not blanked), so every later row moves up
+        one; the row map is renumbered to match.
+        """
+        ids = self._ids(tab_name)
+        i = ids.pop(doc_id, None)
+        if i is not None:
+            del self._cache[tab_name][i]
+            # Later rows moved up one place
+            for key, j in ids.items():
+                if j > i:
+                    ids[key] = j - 1
+
+        row_map = self._row_map.get(tab_name, {})
+        row_num = row_map.pop(doc_id, None)
+        if not row_num:
+            return
+        for key, num in row_map.items():
+            if num > row_num:
+                row_map[key] = num - 1
 
         if not self.demo_mode:
-            row_num = self._row_map.get(tab_name, {}).get(doc_id)
-            if row_num:
-                # Clear the row in sheet (write empty values)
-                headers = self._headers.get(tab_name, [])
-                if headers:
-                    empty = [''] * len(headers)
-                    try:
-                        _retry_on_rate_limit(lambda: self._sheets().values().update(
-                            spreadsheetId=self.spreadsheet_id,
-                            range=f"'{tab_name}'!A{row_num}",
-                            valueInputOption='RAW',
-                            body={'values': [empty]}
-                        ).execute())
-                    except Exception as e:
-                        logger.error(f"Sheet delete error ({tab_name}): {e}")
+            self._write([tab_name], lambda: self._delete_row(tab_name, row_num))
 
-        # Remove from row map
-        self._row_map.get(tab_name, {}).pop(doc_id, None)
+    def _write(self, tabs: List[str], send: Callable[[], None]):
+        """Run one sheet write. If it fails, the tabs it touches are
+        reloaded from the sheet, so the cache and row numbers match what
+        the sheet actually holds.
+        """
+        try:
+            send()
+        except Exception as e:
+            logger.error(f"Sheet write error ({', '.join(tabs)}): {e}")
+            try:
+                for tab_name, rows in self._fetch_tabs(tabs, self._sheets()).items():
+                    self._populate_tab(tab_name, rows)
+            except Exception as reload_error:
+                logger.error(f"Could not reload {', '.join(tabs)} after a failed write: {reload_error}")
+
+    def _append(self, tab_name: str, sheet_rows: List[List[str]]):
+        _retry_on_rate_limit(lambda: self._sheets().values().append(
+            spreadsheetId=self.spreadsheet_id,
+            range=f"'{tab_name}'!A:A",
+            valueInputOption='RAW',
+            insertDataOption='INSERT_ROWS',
+            body={'values': sheet_rows}
+        ).execute())
+
+    def _write_ranges(self, data: List[Dict]):
+        _retry_on_rate_limit(lambda: self._sheets().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'valueInputOption': 'RAW', 'data': data}
+        ).execute())
+
+    def _delete_row(self, tab_name: str, row_num: int):
+        sheets = self._sheets()
+        request = {'deleteDimension': {'range': {
+            'sheetId': self._sheet_id(tab_name, sheets), 'dimension': 'ROWS',
+            'startIndex': row_num - 1, 'endIndex': row_num,
+        }}}
+        _retry_on_rate_limit(lambda: sheets.batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': [request]}
+        ).execute())
 
 
 # Singleton
@@ -425,3 +560,4 @@ async def init_sheets_db() -> SheetsDBService:
     db = get_sheets_db()
     await db.initialize()
     return db
+
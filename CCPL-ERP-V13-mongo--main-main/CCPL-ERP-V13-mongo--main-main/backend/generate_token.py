@@ -7,31 +7,90 @@ STEP 1: python generate_token.py --get-url
 
 STEP 2: python generate_token.py --code=PASTE_CODE_HERE
          -> Saves token.json. Done!
+
+On a machine with a browser, both steps can be done in one run:
+        python generate_token.py --auto
+         -> Opens the auth page and catches the redirect on a local port.
 """
+import argparse
 import json
 import os
-import sys
 
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SCOPES = ('https://www.googleapis.com/auth/spreadsheets',)
 CREDENTIALS_PATH = os.path.join(os.path.dirname(__file__), 'credentials.json')
 TOKEN_PATH = os.path.join(os.path.dirname(__file__), 'token.json')
 
 
+# Parsed client config, keyed by credentials.json (mtime, size)
+_CRED_CACHE = {}
+
+
+def load_client_config():
+    """Parse credentials.json once per file version."""
+    st = os.stat(CREDENTIALS_PATH)
+    key = (st.st_mtime_ns, st.st_size)
+    if _CRED_CACHE.get('key') != key:
+        with open(CREDENTIALS_PATH, 'rb') as f:
+            raw = f.read()
+        cred_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if 'web' in cred_data:
+            # Freshly parsed, so remapping in place cannot touch the cache
+            cred_data['installed'] = cred_data.pop('web')
+        _CRED_CACHE.update(key=key, config=cred_data)
+    return _CRED_CACHE['config']
+
+
 def get_flow():
     from google_auth_oauthlib.flow import InstalledAppFlow
-    with open(CREDENTIALS_PATH, 'r') as f:
-        cred_data = json.load(f)
-    if 'web' in cred_data:
-        client_config = {'installed': cred_data['web']}
-    else:
-        client_config = cred_data
     return InstalledAppFlow.from_client_config(
-        client_config, SCOPES,
+        load_client_config(), SCOPES,
         redirect_uri='http://localhost'
     )
 
 
+def _write_token(creds):
+    """Write token.json in one call from the JSON string creds already builds.
+    The file is written next to token.json and renamed over it, so a crash
+    mid-write never leaves a truncated token. It is created owner-only
+    (0600) since it holds a refresh token.
+    """
+    data = creds.to_json().encode()
+    tmp_path = TOKEN_PATH + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, TOKEN_PATH)
+
+
+def load_saved_token():
+    """Return the saved credentials if still usable, refreshing (and
+    re-saving) an expired token that has a refresh token. None otherwise.
+    """
+    if not os.path.exists(TOKEN_PATH):
+        return None
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
+    try:
+        creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
+        if not creds.valid and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+            _write_token(creds)
+    except Exception as e:
+        print(f"Saved token unusable ({e}); generating a new one.")
+        return None
+    return creds if creds.valid else None
+
+
 def step1_get_url():
+    if load_saved_token():
+        print(f"\ntoken.json is valid: {TOKEN_PATH}")
+        print("Nothing to do. Delete it to generate a new token.")
+        return
     flow = get_flow()
     auth_url, _ = flow.authorization_url(prompt='consent', access_type='offline')
     print("\n" + "="*60)
@@ -49,22 +108,32 @@ def step1_get_url():
 def step2_save_token(code):
     flow = get_flow()
     flow.fetch_token(code=code)
-    creds = flow.credentials
-    with open(TOKEN_PATH, 'w') as f:
-        f.write(creds.to_json())
+    _write_token(flow.credentials)
     print(f"\ntoken.json saved to: {TOKEN_PATH}")
     print("Google Sheets is now connected!")
     print("Start the backend: python -m uvicorn app.main:app --reload")
 
 
+def run_auto():
+    if load_saved_token():
+        print(f"\ntoken.json is valid: {TOKEN_PATH}")
+        return
+    flow = get_flow()
+    _write_token(flow.run_local_server(port=0, prompt='consent', access_type='offline'))
+    print(f"\ntoken.json saved to: {TOKEN_PATH}")
+
+
 if __name__ == '__main__':
-    args = sys.argv[1:]
-    if not args or '--get-url' in args:
-        step1_get_url()
-    elif any(a.startswith('--code=') for a in args):
-        code = next(a.split('=', 1)[1] for a in args if a.startswith('--code='))
-        step2_save_token(code)
+    parser = argparse.ArgumentParser(description="Generate token.json for Google Sheets access.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--get-url', action='store_true', help="step 1: print the auth URL (default)")
+    mode.add_argument('--code', help="step 2: exchange the code from the redirect URL")
+    mode.add_argument('--auto', action='store_true', help="both steps in one run via a local server")
+    args = parser.parse_args()
+
+    if args.auto:
+        run_auto()
+    elif args.code:
+        step2_save_token(args.code)
     else:
-        print("Usage:")
-        print("  python generate_token.py --get-url")
-        print("  python generate_token.py --code=YOUR_AUTH_CODE")
+        step1_get_url()